@@ -2,15 +2,11 @@
 """
 http://projecteuler.net/
 """
-import json
 import math
-import sys
 import itertools as it
 import operator as op
-from argparse import ArgumentParser
 from functools import reduce
 from importlib import import_module
-from pathlib import Path
 from timeit import Timer
 
 
@@ -136,6 +132,35 @@ def is_prime(n, memo={1: False, 2: True, 3: True}):
     return memo[n]
 
 
+def miller_rabin(n, bases=(2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)):
+    """strong probable prime test.  with the default bases it is exact for n < 3.3 * 10**24
+
+    >>> [x for x in range(20) if miller_rabin(x)]
+    [2, 3, 5, 7, 11, 13, 17, 19]
+    >>> miller_rabin(2 ** 89 - 1), miller_rabin(3825123056546413051)
+    (True, False)"""
+    if n < 2:
+        return False
+    for p in bases:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
 def primes(n):
     """prime sieve, lists primes less than n
 
@@ -158,6 +183,30 @@ def primes(n):
     return [i for i, x in enumerate(r) if x]
 
 
+def odd_sieve(n):
+    """numpy bitmap of the odd primes below n: entry i is True iff 2 * i + 1 is prime"""
+    import numpy as np
+    r = np.ones(n // 2, dtype=bool)
+    r[:1] = False
+    for i in range(1, (math.isqrt(max(n - 1, 0)) + 1) // 2):
+        if r[i]:
+            p = 2 * i + 1
+            r[p * p // 2::p] = False
+    return r
+
+
+def prime_array(n):
+    """numpy counterpart of primes(n)
+
+    >>> prime_array(30).tolist() == primes(30)
+    True"""
+    import numpy as np
+    if n <= 2:
+        return np.zeros(0, dtype=np.int64)
+    odd = 2 * np.flatnonzero(odd_sieve(n)) + 1
+    return np.concatenate([[2], odd]).astype(np.int64)
+
+
 class SetOfThings:
 
     """A set-like abstraction which hides a callable deterministic test"""
@@ -175,6 +224,278 @@ class SetOfThings:
 Primes = SetOfThings(is_prime)
 
 
+class PrimeTable:
+
+    """The primes below limit, with a sieve bitmap for membership and int64
+    prefix sums, so that the sum of any run of consecutive primes is O(1)
+
+    >>> table = PrimeTable(1000)
+    >>> table.window_sum(0, 6)
+    41
+    >>> table.longest_prime_window(100), table.longest_prime_window(1000)
+    ((41, 0, 6), (953, 3, 21))"""
+
+    def __init__(self, limit):
+        import numpy as np
+        self.limit = limit
+        self.odd = odd_sieve(limit)
+        self.primes = prime_array(limit)
+        self.prefix = np.concatenate([[0], np.cumsum(self.primes, dtype=np.int64)])
+
+    def __len__(self):
+        return len(self.primes)
+
+    def __contains__(self, n):
+        if n >= self.limit:
+            raise ValueError(f'{n} is beyond the table, which stops at {self.limit}')
+        return n == 2 or (n > 2 and n % 2 == 1 and bool(self.odd[n // 2]))
+
+    def contains(self, values):
+        """vectorized membership test, for an array of values below limit"""
+        return (values == 2) | ((values % 2 == 1) & self.odd[values // 2])
+
+    def window_sum(self, i, n):
+        """sum of the n consecutive primes starting from the ith (counting from 0)"""
+        return int(self.prefix[i + n] - self.prefix[i])
+
+    def longest_prime_window(self, bound):
+        """(sum, start, length) of the longest run of consecutive primes whose sum is a prime below bound
+
+        Among equally long runs the one with the smallest sum is returned."""
+        import numpy as np
+        if bound > self.limit:
+            raise ValueError('bound is beyond the table')
+        for n in range(np.searchsorted(self.prefix, bound) - 1, 0, -1):
+            # a run of n primes starting from p sums to at least n * p
+            starts = min(np.searchsorted(self.primes, bound // n + 1), len(self.primes) - n + 1)
+            sums = self.prefix[n:n + starts] - self.prefix[:starts]
+            sums = sums[:np.searchsorted(sums, bound)]
+            hits = np.flatnonzero(self.contains(sums))
+            if len(hits):
+                return int(sums[hits[0]]), int(hits[0]), n
+
+
+class ExtensiblePrimes:
+
+    """All the primes, sieved segment by segment as far as they are asked for.
+
+    The odd bitmap and the primes found are kept, and each extension at least
+    doubles the range, so growing a bound until something turns up costs
+    about one sieve of the final range.  Prefer the shared instance, sieve.
+
+    >>> s = ExtensiblePrimes()
+    >>> ExtensiblePrimes().count(0), ExtensiblePrimes().upto(-3).tolist()
+    (0, [])
+    >>> s.nth(1), s.nth(6), s.count(100), 97 in s, 99 in s
+    (2, 13, 25, True, False)
+    >>> s.upto(20).tolist(), next(p for p in s if p > 10 ** 6)
+    ([2, 3, 5, 7, 11, 13, 17, 19], 1000003)"""
+
+    def __init__(self):
+        self.limit = 0  # everything below limit (which is even) has been sieved
+        self.odd = None  # entry i is True iff 2 * i + 1 is prime
+        self.primes = None
+
+    def _extend(self, n):
+        import numpy as np
+        if n <= self.limit:
+            return
+        lo, hi = self.limit, max(n + n % 2, 2 * self.limit, 1 << 10)
+        if lo == 0:
+            self.odd = odd_sieve(hi)
+            self.primes = prime_array(hi)
+            self.limit = hi
+            return
+        root = math.isqrt(hi - 1)
+        if root >= lo:
+            self._extend(root + 1)
+            lo = self.limit
+            if lo >= hi:
+                return
+        # entry j of the segment stands for lo + 1 + 2 * j
+        segment = np.ones((hi - lo) // 2, dtype=bool)
+        for p in self.primes[1:np.searchsorted(self.primes, root, side='right')].tolist():
+            start = max(p * p, (lo + p) // p * p)
+            if start % 2 == 0:
+                start += p
+            segment[(start - lo - 1) // 2::p] = False
+        self.odd = np.concatenate([self.odd, segment])
+        self.primes = np.concatenate([self.primes, lo + 1 + 2 * np.flatnonzero(segment)])
+        self.limit = hi
+
+    def upto(self, n):
+        """int64 array of the primes below n"""
+        import numpy as np
+        self._extend(n)
+        if self.primes is None:
+            # nothing sieved yet, as n <= 0
+            return np.zeros(0, dtype=np.int64)
+        return self.primes[:np.searchsorted(self.primes, n)]
+
+    def count(self, n):
+        """number of primes below n"""
+        return len(self.upto(n))
+
+    def nth(self, k):
+        """the kth prime, counting from 1"""
+        if k < 1:
+            raise ValueError('primes are counted from 1')
+        # p(k) < k (ln k + ln ln k) for k >= 6
+        estimate = int(k * (math.log(k) + math.log(math.log(k)))) + 1 if k >= 6 else 14
+        self._extend(estimate)
+        return int(self.primes[k - 1])
+
+    def __iter__(self):
+        i = 0
+        while True:
+            if self.primes is None or i == len(self.primes):
+                self._extend(self.limit + 1)
+            yield int(self.primes[i])
+            i += 1
+
+    def __contains__(self, n):
+        self._extend(n + 1)
+        return n == 2 or (n > 2 and n % 2 == 1 and bool(self.odd[n // 2]))
+
+
+sieve = ExtensiblePrimes()
+
+
+def prime_sum_table(n, f, F, dtype):
+    """Lucy_Hedgehog's O(n^(3/4)) sums of a completely multiplicative f over the primes.
+
+    F(v) must give the sums f(2) + f(3) + ... + f(v) for an int64 array of v,
+    and f(p) a scalar, both of the given numpy dtype (or its name): only ring
+    operations are used, so wrapping unsigned ints (arithmetic modulo 2**64) work as well as
+    floats or python ints (dtype object).  Returns (small, large) with
+    small[v] the sum over primes p <= v, for v <= isqrt(n), and large[k] the
+    sum over primes p <= n // k, for 1 <= k <= isqrt(n)
+
+    >>> small, large = prime_sum_table(100, lambda p: 1, lambda v: v - 1, 'int64')
+    >>> int(large[1]), int(large[3]), int(small[10])
+    (25, 11, 4)"""
+    import numpy as np
+    dtype = np.dtype(dtype).type
+    r = math.isqrt(n)
+    v = np.arange(r + 1, dtype=np.int64)
+    small = np.asarray(F(np.maximum(v, 1)), dtype=dtype)
+    k = np.arange(1, r + 1, dtype=np.int64)
+    large = np.concatenate([small[:1], np.asarray(F(n // k), dtype=dtype)])
+    for p in prime_array(r + 1).tolist():
+        sp, fp, p2 = small[p - 1], dtype(f(p)), p * p
+        # large[k] = S(n // k) -= f(p) (S(n // (k p)) - S(p - 1)), for n // k >= p^2
+        kmax = min(r, n // p2)
+        split = min(r // p, kmax)
+        large[1:split + 1] -= fp * (large[p:split * p + 1:p] - sp)
+        if split < kmax:
+            large[split + 1:kmax + 1] -= fp * (small[n // (p * np.arange(split + 1, kmax + 1))] - sp)
+        if p2 <= r:
+            u = np.arange(p2, r + 1)
+            small[p2:] -= fp * (small[u // p] - sp)
+    return small, large
+
+
+def prime_pi(n):
+    """the number of primes <= n
+
+    >>> prime_pi(10), prime_pi(10 ** 6), prime_pi(10 ** 10)
+    (4, 78498, 455052511)"""
+    import numpy as np
+    if n < 2:
+        return 0
+    return int(prime_sum_table(n, lambda p: 1, lambda v: v - 1, np.int64)[1][1])
+
+
+def prime_sum(n):
+    """the sum of the primes <= n, exactly.
+
+    The sums overflow int64 for n beyond a few billions, so they are run
+    twice: modulo 2**64 in uint64, and approximately in float64.  The float
+    is close enough to pick the one int with that residue
+
+    >>> prime_sum(10), prime_sum(2 * 10 ** 6), prime_sum(10 ** 10)
+    (17, 142913828922, 2220822432581729238)"""
+    import numpy as np
+    if n < 2:
+        return 0
+
+    def wrapped(v):
+        v = v.astype(np.uint64)
+        one = np.uint64(1)
+        return np.where(v % 2 == 0, v // 2 * (v + one), (v + one) // 2 * v) - one
+
+    residue = int(prime_sum_table(n, lambda p: p, wrapped, np.uint64)[1][1])
+    approx = prime_sum_table(n, lambda p: p, lambda v: v * (v + 1.0) / 2 - 1, np.float64)[1][1]
+    q = (int(approx) - residue + 2 ** 63) >> 64
+    return residue + (q << 64)
+
+
+def omega_sieve(n, k=None, start=0):
+    """uint8 array of the number of distinct prime factors of start, start + 1, ... n - 1
+
+    With k given, only primes up to n / (product of the first k - 1 primes)
+    are sieved: a number below n with k or more distinct prime factors has
+    none larger, so counts of k and above are exact, and lower counts stay
+    below k.
+
+    >>> omega_sieve(16).tolist()
+    [0, 0, 1, 1, 1, 1, 2, 1, 1, 1, 2, 1, 2, 1, 2, 2]
+    >>> omega_sieve(16, start=10).tolist()
+    [2, 1, 2, 1, 2, 2]"""
+    import numpy as np
+    bound = n - 1
+    if k is not None:
+        primorial = 1
+        for p in prime_array(100)[:max(k - 1, 0)].tolist():
+            primorial *= p
+        bound = (n - 1) // primorial
+    counts = np.zeros(max(n - start, 0), dtype=np.uint8)
+    first = max(start, 1)  # 0 is left at 0
+    for p in prime_array(bound + 1).tolist():
+        counts[first - start + -first % p::p] += 1
+    return counts
+
+
+def first_run(mask, length):
+    """index of the first run of length consecutive true entries of a boolean array, or None
+
+    >>> first_run([0, 1, 1, 0, 1, 1, 1], 3), first_run([1, 1], 3)
+    (4, None)"""
+    import numpy as np
+    mask = np.asarray(mask, dtype=bool)
+    if length > len(mask):
+        return None
+    c = np.concatenate([[0], np.cumsum(mask, dtype=np.int64)])
+    hits = np.flatnonzero(c[length:] - c[:-length] == length)
+    return int(hits[0]) if len(hits) else None
+
+
+def consecutive_distinct_factors(k, length=None, start=1 << 10, limit=None, segment=1 << 24):
+    """first of `length` (by default k) consecutive integers with exactly k distinct prime factors each,
+    or None if there is no such run below limit
+
+    The integers are sieved in segments of doubling size, up to `segment`
+    integers, until a run turns up, each segment overlapping the last one by
+    length - 1.  Memory stays O(segment), but without a limit the search only
+    stops at a run: k = 6 would take about 2 * 10**10 integers.
+
+    >>> consecutive_distinct_factors(2), consecutive_distinct_factors(3)
+    (14, 644)
+    >>> print(consecutive_distinct_factors(4, limit=100000))
+    None"""
+    length = k if length is None else length
+    lo, hi = 0, start
+    while limit is None or lo < limit:
+        if limit is not None:
+            hi = min(hi, limit)
+        begin = max(lo - length + 1, 0)
+        found = first_run(omega_sieve(hi, k, begin) == k, length)
+        if found is not None:
+            return begin + found
+        lo, hi = hi, hi + min(hi, segment)
+    return None
+
+
 def is_pentagonal(n):
     try:
         x = isqrt(24 * n + 1)
@@ -258,6 +579,396 @@ def nCr(n, r, memo={}):
     return memo[n, r]
 
 
+def _pentagonal_partitions(n, mod, leaf=64):
+    # p(k) = sum over generalised pentagonals g(j) <= k of sign(j) * p(k - g(j)), solved by
+    # divide and conquer: once p is known on the left half of a range, every offset adds
+    # one slice of it to the right half.  Short ranges are finished in python ints.
+    import numpy as np
+    offsets, signs = [], []
+    for j in it.count(1):
+        if pentagonal(j) > n:
+            break
+        offsets += [pentagonal(j), pentagonal(-j)]
+        signs += [(-1) ** (j + 1)] * 2
+    dtype = object if mod is None else np.int64
+    p = np.zeros(n + 1, dtype=dtype)
+    # the terms of the recurrence added so far; between the additions of two ranges
+    # this stays below mod, and within one it takes at most `batch` more terms below mod
+    acc = np.zeros(n + 1, dtype=dtype)
+    acc[0] = 1
+    batch = len(offsets) if mod is None else 2 ** 62 // mod
+
+    def solve(lo, hi):
+        if hi - lo <= leaf:
+            values = acc[lo:hi].tolist()
+            for i in range(hi - lo):
+                for g, sign in zip(offsets, signs):
+                    if g > i:
+                        break
+                    values[i] += sign * values[i - g]
+                if mod is not None:
+                    values[i] %= mod
+            p[lo:hi] = values
+            return
+        mid = (lo + hi) // 2
+        solve(lo, mid)
+        for t, (g, sign) in enumerate(zip(offsets, signs)):
+            if g >= hi - lo:
+                break
+            # k in [mid, hi) with k - g in [lo, mid)
+            first, last = max(mid, lo + g), min(hi, mid + g)
+            if sign > 0:
+                acc[first:last] += p[first - g:last - g]
+            else:
+                acc[first:last] -= p[first - g:last - g]
+            if mod is not None and t % batch == batch - 1:
+                acc[mid:hi] %= mod
+        if mod is not None:
+            acc[mid:hi] %= mod
+        solve(mid, hi)
+
+    solve(0, n + 1)
+    return p.tolist()
+
+
+def partition_counts(n, parts=None, mod=None):
+    """number of ways to write each of 0, 1, ... n as a sum of parts, ignoring order.
+
+    parts=None allows every positive integer (the partition function p), which
+    is counted with Euler's pentagonal number recurrence.  That still takes
+    O(n**1.5) additions, done a slice at a time in numpy: about 0.25s for
+    n = 10**5 and 3s for 10**6 with a modulus.  Otherwise each part is folded
+    in with one pass of cumulative sums along its residue classes.  Counts are
+    exact python ints, or reduced modulo mod, which must then be below 2**62.
+
+    >>> partition_counts(10)
+    [1, 1, 2, 3, 5, 7, 11, 15, 22, 30, 42]
+    >>> partition_counts(10, parts=(2, 5))
+    [1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 2]
+    >>> partition_counts(200, mod=1000) == [x % 1000 for x in partition_counts(200)]
+    True"""
+    import numpy as np
+    if mod is not None and not 0 < mod < 2 ** 62:
+        raise ValueError('mod must be positive and below 2**62')
+    if parts is None:
+        return _pentagonal_partitions(n, mod)
+    dtype = object if mod is None else np.int64
+    ways = np.zeros(n + 1, dtype=dtype)
+    ways[0] = 1 if mod is None else 1 % mod
+    # rows of a cumulative sum which can be added up before reducing: each entry is below mod
+    rows_per_sum = None if mod is None else 2 ** 63 // mod - 1
+    for c in parts:
+        if c <= 0:
+            raise ValueError('parts must be positive')
+        rows = -(-(n + 1) // c)
+        buf = np.zeros(rows * c, dtype=dtype)
+        buf[:n + 1] = ways
+        grid = buf.reshape(rows, c)
+        if mod is None:
+            np.cumsum(grid, axis=0, out=grid)
+        else:
+            for lo in range(0, rows, rows_per_sum):
+                block = grid[lo:lo + rows_per_sum]
+                if lo:
+                    block[0] += grid[lo - 1]
+                np.cumsum(block, axis=0, out=block)
+                block %= mod
+        ways = buf[:n + 1]
+    return ways.tolist()
+
+
+def count_partitions(target, parts=None, mod=None):
+    """number of ways to make target as a sum of parts (coin change), see partition_counts
+
+    >>> count_partitions(100)
+    190569292
+    >>> count_partitions(200, parts=(1, 2, 5, 10, 20, 50, 100, 200))
+    73682
+    >>> count_partitions(10 ** 4, mod=10 ** 6)
+    435144"""
+    return partition_counts(target, parts, mod)[target]
+
+
+class _Fenwick:
+
+    """binary indexed tree over a list of counts: prefix sums and updates in O(log n)"""
+
+    def __init__(self, counts):
+        self.tree = [0] + list(counts)
+        for i in range(1, len(self.tree)):
+            j = i + (i & -i)
+            if j < len(self.tree):
+                self.tree[j] += self.tree[i]
+
+    def add(self, i, delta):
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        """sum of counts[:i]"""
+        total = 0
+        while i:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def search(self, target):
+        """smallest i such that sum(counts[:i + 1]) > target"""
+        i = 0
+        step = 1 << len(self.tree).bit_length()
+        while step:
+            if i + step < len(self.tree) and self.tree[i + step] <= target:
+                i += step
+                target -= self.tree[i]
+            step >>= 1
+        return i
+
+
+def _multiset(seq):
+    values = sorted(set(seq))
+    counts = [0] * len(values)
+    index = {v: i for i, v in enumerate(values)}
+    for x in seq:
+        counts[index[x]] += 1
+    total = math.factorial(len(seq))
+    for c in counts:
+        total //= math.factorial(c)
+    return values, counts, index, total
+
+
+def nth_permutation(seq, k):
+    """the kth (from 0) of the distinct permutations of seq, in lexicographic order.
+
+    Uses the factorial number system, generalised to multisets: of the total
+    permutations of the remaining m items, total * count(v) / m start with v.
+
+    >>> nth_permutation(range(3), 3)
+    [1, 2, 0]
+    >>> [''.join(nth_permutation('aabb', k)) for k in range(6)]
+    ['aabb', 'abab', 'abba', 'baab', 'baba', 'bbaa']
+    >>> nth_permutation(range(20), 10 ** 18)
+    [8, 4, 3, 10, 16, 7, 13, 6, 17, 9, 18, 12, 2, 5, 19, 1, 14, 15, 0, 11]"""
+    seq = list(seq)
+    values, counts, _, total = _multiset(seq)
+    if not 0 <= k < total:
+        raise IndexError('permutation index out of range')
+    tree = _Fenwick(counts)
+    result = []
+    for m in range(len(seq), 0, -1):
+        i = tree.search(k * m // total)
+        k -= total * tree.prefix(i) // m
+        total = total * counts[i] // m
+        counts[i] -= 1
+        tree.add(i, -1)
+        result.append(values[i])
+    return result
+
+
+def permutation_rank(perm):
+    """inverse of nth_permutation: the lexicographic index of perm among the permutations of its items
+
+    >>> permutation_rank([1, 2, 0])
+    3
+    >>> permutation_rank('baba')
+    4
+    >>> permutation_rank(nth_permutation(range(20), 10 ** 18))
+    1000000000000000000"""
+    perm = list(perm)
+    _, counts, index, total = _multiset(perm)
+    tree = _Fenwick(counts)
+    rank = 0
+    for m, x in zip(range(len(perm), 0, -1), perm):
+        i = index[x]
+        rank += total * tree.prefix(i) // m
+        total = total * counts[i] // m
+        counts[i] -= 1
+        tree.add(i, -1)
+    return rank
+
+
+def sumset_upto(values, n):
+    """bitmap of the numbers 0..n that are a sum of two (not necessarily distinct) values.
+
+    The indicator vector of values is convolved with itself by FFT, so the cost
+    is O(n log n) however many values there are
+
+    >>> [k for k, x in enumerate(sumset_upto([1, 3], 7)) if x]
+    [2, 4, 6]
+    >>> sumset_upto([12, 18, 20], 40).nonzero()[0].tolist()
+    [24, 30, 32, 36, 38, 40]"""
+    import numpy as np
+    values = np.asarray(values, dtype=np.int64)
+    indicator = np.zeros(n + 1)
+    indicator[values[(0 <= values) & (values <= n)]] = 1
+    size = 1 << (2 * n + 1).bit_length()
+    spectrum = np.fft.rfft(indicator, size)
+    counts = np.fft.irfft(spectrum * spectrum, size)[:n + 1]
+    return counts > 0.5
+
+
+def _champernowne_blocks(k_max, base):
+    # (index of the first digit, first number, digits per number) of each block of equal-length numbers
+    blocks = [(0, 1, 1)]
+    while True:
+        start, first, length = blocks[-1]
+        end = start + (base - 1) * first * length
+        if end > k_max:
+            return blocks
+        blocks.append((end, first * base, length + 1))
+
+
+def champernowne_digit(k, base=10):
+    """kth digit (from 1) of the fractional part of 0.123456789101112..., written in base
+
+    >>> [champernowne_digit(k) for k in range(9, 16)]
+    [9, 1, 0, 1, 1, 1, 2]
+    >>> champernowne_digit(10 ** 18)
+    3"""
+    if k < 1:
+        raise ValueError('digits are counted from 1')
+    start, first, length = _champernowne_blocks(k - 1, base)[-1]
+    number, position = divmod(k - 1 - start, length)
+    return (first + number) // base ** (length - 1 - position) % base
+
+
+def champernowne_digits(indices, base=10):
+    """champernowne_digit for an array of indices at once (up to about 10**18)
+
+    >>> champernowne_digits([10 ** d for d in range(7)]).tolist()
+    [1, 1, 5, 3, 7, 2, 1]"""
+    import numpy as np
+    k = np.asarray(indices, dtype=np.int64) - 1
+    if k.size and k.min() < 0:
+        raise ValueError('digits are counted from 1')
+    blocks = np.array(_champernowne_blocks(int(k.max(initial=0)), base), dtype=np.int64)
+    starts, firsts, lengths = blocks.T
+    b = np.searchsorted(starts, k, side='right') - 1
+    number, position = np.divmod(k - starts[b], lengths[b])
+    powers = base ** np.arange(lengths[-1], dtype=np.int64)
+    return (firsts[b] + number) // powers[lengths[b] - 1 - position] % base
+
+
+def power_sum_mod(terms, m):
+    """sum of a ** b over the pairs (a, b) of terms, modulo m, without ever forming a ** b
+
+    >>> power_sum_mod(((i, i) for i in range(1, 11)), 10 ** 10)
+    405071317"""
+    return sum(pow(a, b, m) for a, b in terms) % m
+
+
+def mulmod(a, b, m):
+    """a * b % m elementwise, for uint64 arrays with entries below m < 2**62.
+
+    Products which may overflow are reduced with a float64 estimate of the
+    quotient (exact to within one for m < 2**50), or above that by feeding b
+    in chunks of bits small enough that nothing overflows, Horner style"""
+    import numpy as np
+    a, b = np.asarray(a, dtype=np.uint64), np.asarray(b, dtype=np.uint64)
+    width = int(np.max(m)).bit_length()
+    if width > 62:
+        raise ValueError('modulus must be below 2**62')
+    if 2 * width <= 64:
+        return a * b % m
+    m = np.asarray(m, dtype=np.uint64)
+    if width <= 50:
+        q = a.astype(np.float64)
+        q *= b
+        q *= 1 / m.astype(np.float64)
+        q = np.floor(q, out=q).astype(np.int64)
+        # a * b - q * m wraps around modulo 2**64, but the true value is within m of [0, m)
+        m = m.astype(np.int64)
+        r = (a * b).view(np.int64)
+        q *= m
+        r -= q
+        r += (r < 0) * m
+        r -= (r >= m) * m
+        return r.view(np.uint64)
+    bits = 64 - width - 1
+    chunks = -(-width // bits)
+    mask = np.uint64((1 << bits) - 1)
+    r = np.zeros(np.broadcast(a, b).shape, dtype=np.uint64)
+    for i in reversed(range(chunks)):
+        r = ((r << np.uint64(bits)) % m + a * (b >> np.uint64(i * bits) & mask)) % m
+    return r
+
+
+def pow_mod(bases, exponents, m):
+    """pow(a, e, m) elementwise, by square and multiply over arrays (m may be an array too)
+
+    >>> pow_mod([2, 3, 10], [10, 5, 0], 1000).tolist()
+    [24, 243, 1]
+    >>> pow_mod(3, [2 ** 40], [10 ** 12, 10 ** 15 + 37]).tolist() == [pow(3, 2 ** 40, 10 ** 12), pow(3, 2 ** 40, 10 ** 15 + 37)]
+    True"""
+    import numpy as np
+    m = np.asarray(m, dtype=np.uint64)
+    base = np.asarray(bases, dtype=np.uint64) % m
+    e = np.asarray(exponents, dtype=np.uint64)
+    result = np.ones(np.broadcast(base, e, m).shape, dtype=np.uint64) % m
+    while e.any():
+        odd = (e & np.uint64(1)).astype(bool)
+        result = np.where(odd, mulmod(result, base, m), result)
+        base = mulmod(base, base, m)
+        e = e >> np.uint64(1)
+    return result
+
+
+def self_power_sum_mod(n, m, chunk=1 << 16):
+    """1 ** 1 + 2 ** 2 + ... + n ** n modulo m, with numpy in chunks of terms
+
+    >>> self_power_sum_mod(1000, 10 ** 10) == sum(i ** i for i in range(1, 1001)) % 10 ** 10
+    True"""
+    import numpy as np
+    total = 0
+    for start in range(1, n + 1, chunk):
+        i = np.arange(start, min(start + chunk, n + 1), dtype=np.uint64)
+        terms = pow_mod(i, i, m)
+        # sum the 32-bit halves separately so that nothing overflows
+        total += (int((terms >> np.uint64(32)).sum()) << 32) + int((terms & np.uint64(0xffffffff)).sum())
+    return total % m
+
+
+def _distinct_exponents(k_max, b_max):
+    """number of distinct products k * b for 1 <= k <= k_max, 2 <= b <= b_max"""
+    if k_max == 1:
+        return b_max - 1
+    seen = bytearray(k_max * b_max + 1)
+    for k in range(1, k_max + 1):
+        seen[2 * k:k * b_max + 1:k] = b'\1' * (b_max - 1)
+    return seen.count(1)
+
+
+def count_distinct_powers(a_max, b_max):
+    """number of distinct values a ** b for 2 <= a <= a_max, 2 <= b <= b_max
+
+    Writing each a as r ** k with r not a perfect power, r ** (k * b) only
+    collides with powers of the same r, so a root with k = 1 .. K powers up
+    to a_max contributes the number of distinct products k * b, which only
+    depends on K and is counted once per K in a bitmap.  No power is ever
+    computed.
+
+    >>> count_distinct_powers(5, 5), count_distinct_powers(100, 100)
+    (15, 9183)"""
+    if a_max < 2 or b_max < 2:
+        return 0
+    root = math.isqrt(a_max)
+    perfect = set()  # perfect powers up to a_max
+    roots = {}  # K -> number of roots r with exactly K powers r, r ** 2 ... r ** K up to a_max
+    for r in range(2, root + 1):
+        if r in perfect:
+            continue
+        k, x = 1, r
+        while x * r <= a_max:
+            x *= r
+            k += 1
+            perfect.add(x)
+        roots[k] = roots.get(k, 0) + 1
+    # every number above sqrt(a_max) that is not a perfect power is a root with K = 1
+    roots[1] = roots.get(1, 0) + a_max - root - sum(1 for x in perfect if x > root)
+    return sum(n * _distinct_exponents(k, b_max) for k, n in roots.items())
+
+
 def get_result(modname):
     module = import_module(f'euler.{modname}')
     return getattr(module, 'result', None)
@@ -269,36 +980,3 @@ def my_timeit(func, *args, **kwargs):
         wrapper.result = func(*args, **kwargs)
     return Timer(wrapper).timeit(1), wrapper.result
 
-
-if __name__ == '__main__':
-
-    import doctest
-    doctest.testmod()
-
-    parser = ArgumentParser("Wim's project euler progress")
-    parser.add_argument('--all', action='store_true')
-    parser.add_argument('ids', type=int, nargs='*', default=[])
-    args = parser.parse_args()
-
-    here = Path(__file__).parent
-    sys.path.append(str(here.parent))
-    my_answers = json.loads((here/'../data/my_answers.json').read_text())
-    if args.ids:
-        problems = [f'p{n:03d}' for n in args.ids]
-    else:
-        problems = [p.name[:-3] for p in here.glob('p*.py')]
-        if not args.all:
-            problems = [max(problems)]
-
-    total_time = 0
-    for p in sorted(problems):
-        delta, answer = my_timeit(get_result, p)
-        total_time += delta
-        if answer is not None and type(answer) is not int:
-            print(f'{p} result is instance {type(answer)}, expected int')
-        print(f' {p}: {answer:16d} ({delta:.02f}s)')
-        assert answer == my_answers.get(p, answer)
-
-    if len(problems) > 1:
-        print('-' * 40)
-        print(f' total time : {total_time:.02f} s')
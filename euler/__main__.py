@@ -0,0 +1,87 @@
+"""
+python -m euler [--all] [--selftest] [--import-time] [ids ...]
+"""
+import json
+import re
+import subprocess
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+from euler import get_result, my_timeit
+
+here = Path(__file__).parent
+
+
+def selftest():
+    """run the doctests of the helper modules (not the problems, which would solve themselves on import)"""
+    import doctest
+    from importlib import import_module
+    modules = ['euler'] + [f'euler.{p.stem}' for p in sorted(here.glob('*.py'))
+                           if not re.fullmatch(r'p\d{3}|__init__|__main__', p.stem)]
+    failed = 0
+    for name in modules:
+        failed += doctest.testmod(import_module(name)).failed
+    print(f' doctests: {"FAILED" if failed else "ok"} ({len(modules)} modules)')
+    return failed
+
+
+def import_times(modname):
+    """(self, cumulative, depth, name) rows from a fresh `python -X importtime -c "import <modname>"`"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modname}'],
+                          cwd=here.parent, capture_output=True, text=True, check=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)', line)
+        if m:
+            rows.append((int(m[1]), int(m[2]), len(m[3]) // 2, m[4]))
+    return rows
+
+
+def import_time_report(problems, top=5):
+    """startup cost of each problem: interpreter + euler + dependencies, excluding the solve itself"""
+    for p in problems:
+        rows = import_times(f'euler.{p}')
+        total = sum(cum for _, cum, depth, _ in rows if depth == 0)
+        solve = next(self for self, _, _, name in rows if name == f'euler.{p}')
+        heavy = sorted((r for r in rows if r[2] <= 1 and r[3] != f'euler.{p}'), key=lambda r: r[1], reverse=True)[:top]
+        print(f' {p}: {(total - solve) / 1000:7.1f} ms startup, ' +
+              ', '.join(f'{name} {cum / 1000:.1f} ms' for _, cum, _, name in heavy))
+
+
+if __name__ == '__main__':
+
+    parser = ArgumentParser("Wim's project euler progress")
+    parser.add_argument('--all', action='store_true')
+    parser.add_argument('--selftest', action='store_true', help='run the helper doctests first')
+    parser.add_argument('--import-time', action='store_true', help='report import overhead instead of solving')
+    parser.add_argument('ids', type=int, nargs='*', default=[])
+    args = parser.parse_args()
+
+    if args.selftest and selftest():
+        sys.exit(1)
+
+    my_answers = json.loads((here/'../data/my_answers.json').read_text())
+    if args.ids:
+        problems = [f'p{n:03d}' for n in args.ids]
+    else:
+        problems = [p.stem for p in here.glob('p*.py') if re.fullmatch(r'p\d{3}', p.stem)]
+        if not args.all:
+            problems = [max(problems)]
+
+    if args.import_time:
+        import_time_report(sorted(problems))
+        sys.exit()
+
+    total_time = 0
+    for p in sorted(problems):
+        delta, answer = my_timeit(get_result, p)
+        total_time += delta
+        if answer is not None and type(answer) is not int:
+            print(f'{p} result is instance {type(answer)}, expected int')
+        print(f' {p}: {answer!s:>16} ({delta:.02f}s)')
+        assert answer == my_answers.get(p, answer)
+
+    if len(problems) > 1:
+        print('-' * 40)
+        print(f' total time : {total_time:.02f} s')
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+micro-benchmarks for the helper library
+
+Every helper is timed over a few representative input distributions, and
+every alternative implementation ("backend") of the same helper is timed on
+exactly the same inputs, so they can be compared side by side.  Loop counts
+are calibrated with Timer.autorange after a warmup pass, and the best of
+several repeats is reported as time per call.
+
+    python -m euler.bench
+    python -m euler.bench gcd isqrt --save
+    python -m euler.bench --compare
+"""
+import json
+import math
+import platform
+import random
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+from timeit import Timer
+
+import euler
+
+HISTORY = Path(__file__).parent.parent / 'data' / 'bench_history.jsonl'
+
+
+def _ints(rng, lo, hi, k=100):
+    return [(rng.randrange(lo, hi),) for _ in range(k)]
+
+
+def _pairs(rng, lo, hi, k=100):
+    return [(rng.randrange(lo, hi), rng.randrange(lo, hi)) for _ in range(k)]
+
+
+def _squares(rng, bits, k=100):
+    return [(rng.getrandbits(bits) ** 2,) for _ in range(k)]
+
+
+def _choose(rng, hi, k=100):
+    return [(n, rng.randrange(n + 1)) for n in (rng.randrange(1, hi) for _ in range(k))]
+
+
+def _fib_pairs(k=100):
+    f = euler.fib_gen()
+    fibs = [next(f) for _ in range(k + 2)]
+    return list(zip(fibs[2:], fibs[1:]))
+
+
+def cases(seed=0):
+    """helper name -> {distribution name -> list of argument tuples}"""
+    rng = random.Random(seed)
+    small_primes = euler.primes(10 ** 4)
+    return {
+        'primes': {
+            '10^3': [(10 ** 3,)],
+            '10^5': [(10 ** 5,)],
+            '10^6': [(10 ** 6,)],
+        },
+        'is_prime': {
+            'small': _ints(rng, 4, 10 ** 3),
+            'medium': _ints(rng, 4, 10 ** 6),
+            'large': _ints(rng, 10 ** 8, 10 ** 9),
+        },
+        'factorise': {
+            'small': _ints(rng, 2, 10 ** 4),
+            'medium': _ints(rng, 2, 10 ** 8),
+            'semiprime': [(rng.choice(small_primes) * rng.choice(small_primes),) for _ in range(20)],
+        },
+        'divisors': {
+            'small': _ints(rng, 1, 10 ** 4),
+            'medium': _ints(rng, 1, 10 ** 8),
+            'highly composite': [(720720,), (735134400,)],
+        },
+        'gcd': {
+            'small': _pairs(rng, 1, 10 ** 3),
+            '64-bit': _pairs(rng, 1, 2 ** 64),
+            'fibonacci': _fib_pairs(),
+        },
+        'nCr': {
+            'n < 30': _choose(rng, 30),
+            'n < 300': _choose(rng, 300),
+            'n < 1000': _choose(rng, 1000),
+        },
+        'isqrt': {
+            'small': _squares(rng, 10),
+            '64-bit': _squares(rng, 32),
+            '1000-bit': _squares(rng, 500),
+        },
+        'fib': {
+            'n < 100': _ints(rng, 0, 100),
+            'n < 500': _ints(rng, 0, 500),
+        },
+    }
+
+
+def backends():
+    """helper name -> {backend name -> callable}
+
+    memoised helpers get an extra backend which is handed a fresh memo on each
+    call, so that the cost of the computation itself is visible too"""
+    return {
+        'primes': {
+            'list sieve': euler.primes,
+            'numpy sieve': euler.prime_array,
+            'segmented sieve': lambda n: euler.ExtensiblePrimes().upto(n),
+        },
+        'is_prime': {
+            'memoised': euler.is_prime,
+            'uncached': lambda n: euler.is_prime(n, {1: False, 2: True, 3: True}),
+            'miller-rabin': euler.miller_rabin,
+        },
+        'factorise': {'trial division': euler.factorise},
+        'divisors': {'from factors': euler.divisors},
+        'gcd': {'recursive': euler.gcd, 'math.gcd': math.gcd},
+        'nCr': {
+            'memoised': euler.nCr,
+            'uncached': lambda n, r: euler.nCr(n, r, {}),
+            'math.comb': math.comb,
+        },
+        'isqrt': {'newton': euler.isqrt, 'math.isqrt': math.isqrt},
+        'fib': {'fib_r': euler.fib_r, 'fib_i': euler.fib_i},
+    }
+
+
+def measure(func, args_list, repeat=5):
+    """best time per call of func over args_list, in seconds"""
+    def loop():
+        for args in args_list:
+            func(*args)
+    loop()  # warmup: fills memos and caches, pages in code
+    timer = Timer(loop)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / (number * len(args_list))
+
+
+def run(helpers=None, repeat=5, seed=0):
+    """generate one result dict per (helper, input distribution, backend)"""
+    all_cases = cases(seed)
+    all_backends = backends()
+    for helper in helpers or all_cases:
+        for dist, args_list in all_cases[helper].items():
+            for backend, func in all_backends[helper].items():
+                t = measure(func, args_list, repeat=repeat)
+                yield {'helper': helper, 'inputs': dist, 'backend': backend, 'seconds': t}
+
+
+def load_history(path=HISTORY):
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def save(results, path=HISTORY):
+    record = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    with path.open('a') as f:
+        f.write(json.dumps(record) + '\n')
+
+
+def fmt_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:7.2f} {unit}'
+    return f'{seconds / 1e-9:7.2f} ns'
+
+
+if __name__ == '__main__':
+
+    parser = ArgumentParser('benchmark the euler helper library')
+    parser.add_argument('helpers', nargs='*', help='helpers to benchmark (default: all)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', action='store_true', help=f'append results to {HISTORY.name}')
+    parser.add_argument('--compare', action='store_true', help='compare against the last saved run')
+    args = parser.parse_args()
+    unknown = set(args.helpers) - set(backends())
+    if unknown:
+        parser.error(f'unknown helpers: {", ".join(sorted(unknown))}')
+
+    previous = {}
+    if args.compare:
+        history = load_history()
+        if not history:
+            sys.exit(f'no saved runs in {HISTORY}')
+        previous = {(r['helper'], r['inputs'], r['backend']): r['seconds'] for r in history[-1]['results']}
+
+    results = []
+    for r in run(args.helpers, repeat=args.repeat, seed=args.seed):
+        line = f' {r["helper"]:10} {r["inputs"]:18} {r["backend"]:16} {fmt_time(r["seconds"])}'
+        old = previous.get((r['helper'], r['inputs'], r['backend']))
+        if old:
+            line += f'  ({r["seconds"] / old:.2f}x)'
+        print(line)
+        results.append(r)
+
+    if args.save:
+        save(results)
@@ -0,0 +1,84 @@
+"""
+continued fractions and their convergents (p057)
+
+Convergents come from the usual recurrence p(k) = a(k) p(k-1) + p(k-2), and
+carry the digit counts of p and q.  As both only ever grow, each count is
+kept up to date by one comparison with the next power of ten, so long runs
+of convergents never convert a big int to a string.
+"""
+from collections import namedtuple
+from itertools import chain, count, cycle, islice
+from math import isqrt
+
+from euler.digits import digit_count
+
+Convergent = namedtuple('Convergent', 'p q p_digits q_digits')
+
+
+class _DigitCounter:
+
+    """decimal digit count of a non-decreasing sequence of ints"""
+
+    def __init__(self, n):
+        self.digits = digit_count(n)
+        self.bound = 10 ** self.digits
+
+    def update(self, n):
+        while n >= self.bound:
+            self.digits += 1
+            self.bound *= 10
+        return self.digits
+
+
+def convergents(terms):
+    """generator yielding the convergents p/q of a continued fraction [a0; a1, a2, ...]
+
+    terms may be infinite; all but the first must be positive.
+
+    >>> [c[:2] for c in convergents([1, 2, 2, 2])]
+    [(1, 1), (3, 2), (7, 5), (17, 12)]
+    >>> c = list(convergents(e_terms(12)))[-1]
+    >>> c
+    Convergent(p=23225, q=8544, p_digits=5, q_digits=4)"""
+    terms = iter(terms)
+    p, q = next(terms), 1
+    p_prev, q_prev = 1, 0
+    p_count, q_count = _DigitCounter(p), _DigitCounter(q)
+    yield Convergent(p, q, p_count.digits, q_count.digits)
+    for a in terms:
+        p, p_prev = a * p + p_prev, p
+        q, q_prev = a * q + q_prev, q
+        yield Convergent(p, q, p_count.update(p), q_count.update(q))
+
+
+def sqrt_cf(n):
+    """(a0, period) of the periodic continued fraction of sqrt(n), the period being empty for squares
+
+    >>> sqrt_cf(2), sqrt_cf(23), sqrt_cf(16)
+    ((1, (2,)), (4, (1, 3, 1, 8)), (4, ()))"""
+    a0 = isqrt(n)
+    if a0 * a0 == n:
+        return a0, ()
+    m, d, a = 0, 1, a0
+    period = []
+    while a != 2 * a0:
+        m = d * a - m
+        d = (n - m * m) // d
+        a = (a0 + m) // d
+        period.append(a)
+    return a0, tuple(period)
+
+
+def sqrt_terms(n):
+    """generator yielding the terms of the continued fraction of sqrt(n) (finite for squares)"""
+    a0, period = sqrt_cf(n)
+    return chain([a0], cycle(period))
+
+
+def e_terms(n=None):
+    """generator yielding the first n terms (all if n is None) of e = [2; 1, 2, 1, 1, 4, 1, 1, 6, ...]
+
+    >>> list(e_terms(10))
+    [2, 1, 2, 1, 1, 4, 1, 1, 6, 1]"""
+    terms = chain([2], (a for k in count(1) for a in (1, 2 * k, 1)))
+    return islice(terms, n)
@@ -0,0 +1,170 @@
+"""
+loaders for the input files in data/
+
+Paths are resolved relative to the package rather than the working directory.
+Parsed forms are cached under data/.cache, keyed on the parser, a digest of
+its code and the source file's mtime and size, so a file is only parsed again
+after it or its parser changes.  Array parsers are cached as .npy files, which
+can be memory-mapped instead of read.
+"""
+import hashlib
+import mmap
+import pickle
+import types
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+CACHE_DIR = DATA_DIR / '.cache'
+
+
+def path(name):
+    """absolute path of a data file, independent of the current working directory"""
+    return DATA_DIR / name
+
+
+def quoted_csv(raw):
+    """b'"MARY","PATRICIA",...' -> ('MARY', 'PATRICIA', ...)
+
+    >>> quoted_csv(b'"A","ABILITY","ABLE"\\n')
+    ('A', 'ABILITY', 'ABLE')"""
+    return tuple(raw.decode('ascii').strip().replace('"', '').split(','))
+
+
+def byte_csv(raw):
+    """b'36,22,80,...' -> bytes([36, 22, 80, ...])
+
+    >>> byte_csv(b'79,59,12\\n')
+    b'O;\\x0c'"""
+    return bytes(map(int, raw.split(b',')))
+
+
+def lines(raw):
+    """one tuple of whitespace separated fields per line
+
+    >>> lines(b'8C TS KC\\n5C AD 5D\\n')
+    (('8C', 'TS', 'KC'), ('5C', 'AD', '5D'))"""
+    return tuple(tuple(line.split()) for line in raw.decode('ascii').splitlines())
+
+
+def _digest_code(code, h):
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _digest_code(const, h)
+        elif isinstance(const, frozenset):
+            # set order depends on string hashing, which changes between runs
+            h.update(repr(sorted(const, key=repr)).encode())
+        else:
+            h.update(repr(const).encode())
+
+
+def _digest(parse, h, seen):
+    # the code of parse and of the functions of its own module which it calls by name
+    seen.add(parse)
+    _digest_code(parse.__code__, h)
+    for name in parse.__code__.co_names:
+        f = parse.__globals__.get(name)
+        if isinstance(f, types.FunctionType) and f.__module__ == parse.__module__ and f not in seen:
+            _digest(f, h, seen)
+
+
+def _cacheable(parse):
+    # lambdas and nested functions are not told apart by their names
+    return isinstance(parse, types.FunctionType) and '<' not in parse.__qualname__
+
+
+def _cache_file(name, parse, suffix, version):
+    stat = path(name).stat()
+    h = hashlib.sha1(repr(version).encode())
+    _digest(parse, h, set())
+    key = f'{stat.st_mtime_ns}-{stat.st_size}-{h.hexdigest()[:12]}'
+    return CACHE_DIR / f'{name}.{parse.__module__}.{parse.__qualname__}.{key}{suffix}'
+
+
+def _store(cached, write):
+    # caching is best effort: False if the cache could not be written (say, a read-only checkout)
+    tmp = cached.with_name(cached.name + '.tmp')
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        # drop entries for older versions of the same file, then write atomically
+        stem = cached.name.rsplit('.', 2)[0]
+        for stale in CACHE_DIR.glob(f'{stem}.*'):
+            stale.unlink()
+        with tmp.open('wb') as f:
+            write(f)
+        tmp.replace(cached)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def load(name, parse, cache=True, version=None):
+    """parse(raw bytes) of data file `name`, pickled in the cache until the file changes
+    (when the cache directory is writable)
+
+    The cache also follows changes to the code of parse, and of the functions
+    of its module which it calls by name.  Bump version when the parse
+    changes through anything else.  Lambdas and nested functions are never
+    cached."""
+    if not cache or not _cacheable(parse):
+        return parse(path(name).read_bytes())
+    cached = _cache_file(name, parse, '.pickle', version)
+    try:
+        with cached.open('rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    value = parse(path(name).read_bytes())
+    _store(cached, lambda f: pickle.dump(value, f, pickle.HIGHEST_PROTOCOL))
+    return value
+
+
+def load_array(name, parse, cache=True, mmap_mode=None, version=None):
+    """like load, for parsers returning numpy arrays.
+
+    The array is cached in .npy format, so with mmap_mode='r' a large parsed
+    input is mapped into memory rather than read"""
+    import numpy as np
+    if not cache or not _cacheable(parse):
+        return parse(path(name).read_bytes())
+    cached = _cache_file(name, parse, '.npy', version)
+    try:
+        return np.load(cached, mmap_mode=mmap_mode)
+    except (OSError, ValueError):
+        pass
+    value = parse(path(name).read_bytes())
+    if _store(cached, lambda f: np.save(f, value)) and mmap_mode is not None:
+        return np.load(cached, mmap_mode=mmap_mode)
+    return value
+
+
+def map_raw(name):
+    """read-only memory map of the raw bytes of a data file, for inputs too large to read"""
+    with path(name).open('rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def names():
+    """p022"""
+    return load('p022_names.txt', quoted_csv)
+
+
+def words():
+    """p042"""
+    return load('p042_words.txt', quoted_csv)
+
+
+def poker():
+    """p054, one row of ten encoded cards per deal (see euler.poker)"""
+    from euler.poker import parse_deals
+    return load_array('p054_poker.txt', parse_deals)
+
+
+def cipher():
+    """p059"""
+    return load('p059_cipher.txt', byte_csv)
@@ -0,0 +1,172 @@
+"""
+primes defined by their digits: circular primes (p035), truncatable primes (p037)
+and digit replacement families (p051)
+
+Circular and truncatable candidates are built digit by digit instead of
+filtering all primes below a bound, and tested with miller_rabin, so whole
+(finite) families can be listed in any base.
+"""
+from functools import reduce
+from itertools import product
+from math import gcd
+
+from euler import miller_rabin
+
+
+def _value(digits, base):
+    return reduce(lambda n, d: n * base + d, digits, 0)
+
+
+def circular_primes(max_digits, base=10):
+    """sorted list of the primes of at most max_digits digits whose every digit rotation is prime
+
+    Every digit of a circular prime with two or more digits ends up in last place,
+    so only digits coprime to the base are used.  Each necklace is tested once,
+    from its smallest rotation.
+
+    >>> circular_primes(2)
+    [2, 3, 5, 7, 11, 13, 17, 31, 37, 71, 73, 79, 97]
+    >>> len(circular_primes(6))
+    55"""
+    found = [p for p in range(2, base) if miller_rabin(p)]
+    allowed = [d for d in range(1, base) if gcd(d, base) == 1]
+    for length in range(2, max_digits + 1):
+        for digits in product(allowed, repeat=length):
+            rotations = {digits[i:] + digits[:i] for i in range(length)}
+            if digits == min(rotations):
+                values = [_value(r, base) for r in rotations]
+                if all(miller_rabin(v) for v in values):
+                    found += values
+    return sorted(found)
+
+
+def right_truncatable_primes(base=10):
+    """every prime which stays prime as digits are removed from the right
+
+    >>> right_truncatable_primes()[:12]
+    [2, 3, 5, 7, 23, 29, 31, 37, 53, 59, 71, 73]
+    >>> len(right_truncatable_primes()), max(right_truncatable_primes())
+    (83, 73939133)"""
+    found = []
+    level = [p for p in range(2, base) if miller_rabin(p)]
+    while level:
+        found += level
+        level = [q for p in level for q in range(p * base, (p + 1) * base) if miller_rabin(q)]
+    return sorted(found)
+
+
+def left_truncatable_primes(base=10):
+    """every zero-free prime which stays prime as digits are removed from the left
+
+    >>> len(left_truncatable_primes()), max(left_truncatable_primes())
+    (4260, 357686312646216567629137)"""
+    found = []
+    level = [p for p in range(2, base) if miller_rabin(p)]
+    power = base
+    while level:
+        found += level
+        level = [q for p in level for q in range(power + p, base * power, power) if miller_rabin(q)]
+        power *= base
+    return sorted(found)
+
+
+def truncatable_primes(base=10):
+    """the primes (of two or more digits) truncatable from both left and right
+
+    >>> truncatable_primes()
+    [23, 37, 53, 73, 313, 317, 373, 797, 3137, 3797, 739397]"""
+    def left_truncatable(p):
+        power = base
+        while power < p:
+            if p % power < power // base or not miller_rabin(p % power):
+                return False
+            power *= base
+        return True
+    return [p for p in right_truncatable_primes(base) if p >= base and left_truncatable(p)]
+
+
+class ReplacementFamilies:
+
+    """prime digit replacement families (p051), indexed in one pass over the primes of at most max_digits digits
+
+    A family is a length, a set of digit positions (the mask) and the digits
+    outside the mask; its members are the primes made by writing the same
+    digit in every masked position.  Each prime is counted in the family of
+    every mask made of positions holding one same digit, and only the size and
+    smallest member of each family are kept, so queries are lookups.
+
+    Families are found with numpy, one pass per mask over the primes of each
+    length, and keyed by one int64 (the prime with the masked digits zeroed,
+    and the mask in the low bits), so the index is two arrays.  All the
+    primes of up to 7 digits (3.5 million families) take about 2s and 330MB.
+
+    >>> families = ReplacementFamilies(2)
+    >>> families.largest()
+    (6, 13)
+    >>> ReplacementFamilies(5).smallest(7)
+    56003"""
+
+    def __init__(self, max_digits, base=10):
+        import numpy as np
+        from euler import prime_array
+        self.base = base
+        primes = prime_array(base ** max_digits)
+        sizes, members = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+        for length in range(1, max_digits + 1):
+            lo, hi = np.searchsorted(primes, [base ** (length - 1), base ** length])
+            keys, replaced = self._pairs(primes[lo:hi], length)
+            # the members of a family share a mask, so they were found in increasing order,
+            # and a stable sort leaves the smallest first
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+            starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))[:len(keys)]
+            sizes.append(np.diff(np.append(starts, len(keys))))
+            members.append(self._member(keys[starts], replaced[order[starts]], length))
+            del keys, replaced, order
+        # size and smallest member of every family
+        self.sizes = np.concatenate(sizes)
+        self.members = np.concatenate(members)
+
+    def _mask_values(self, length):
+        # mask (one bit per position) -> sum of the place values of its positions
+        import numpy as np
+        values = np.zeros(1 << length, dtype=np.int64)
+        for i in range(length):
+            values[1 << i:2 << i] = values[:1 << i] + self.base ** i
+        return values
+
+    def _member(self, keys, d, length):
+        # the prime of the family `keys` whose masked digits are d
+        return (keys >> length) + d * self._mask_values(length)[keys & ((1 << length) - 1)]
+
+    def _pairs(self, primes, length):
+        # (family key, replaced digit) for every family of each of primes, all of the same length;
+        # a key is the prime with its masked digits zeroed, with the mask in the low bits
+        import numpy as np
+        places = self.base ** np.arange(length, dtype=np.int64)
+        digits = (primes[:, None] // places % self.base).astype(np.uint8)
+        mask_values = self._mask_values(length)
+        keys, replaced = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.uint8)]
+        for mask in range(1, 1 << length):
+            columns = [i for i in range(length) if mask >> i & 1]
+            d = digits[:, columns[0]]
+            same = np.ones(len(primes), dtype=bool)
+            for i in columns[1:]:
+                same &= digits[:, i] == d
+            hits = np.flatnonzero(same)
+            keys.append((primes[hits] - d[hits] * mask_values[mask]) << length | mask)
+            replaced.append(d[hits])
+        return np.concatenate(keys), np.concatenate(replaced)
+
+    def largest(self):
+        """(size, smallest member) of the largest family, the one with the smallest member among ties"""
+        import numpy as np
+        if not len(self.sizes):
+            raise ValueError('there are no families')
+        best = np.lexsort((self.members, -self.sizes))[0]
+        return int(self.sizes[best]), int(self.members[best])
+
+    def smallest(self, size):
+        """smallest prime in a family of at least `size` members, or None"""
+        members = self.members[self.sizes >= size]
+        return int(members.min()) if len(members) else None
@@ -0,0 +1,143 @@
+"""
+decimal digits of big integers (p016, p020, p056, p057)
+
+str() of an n digit int is quadratic, and refuses ints of more than 4300
+digits on recent pythons.  Here large ints are split in halves by cached
+powers of ten, and only the small pieces go through str().  Digit counts
+never convert at all: they come from bit_length, checked against a power of
+ten.  Digit sums of whole tables of powers are computed without any
+conversion, on base 10**6 limbs in numpy.
+"""
+from functools import lru_cache
+from math import log10
+
+LOG10_2 = log10(2)
+# ints below this are converted with str() directly
+SMALL = 1000
+
+
+@lru_cache(maxsize=128)
+def pow10(k):
+    return 10 ** k
+
+
+def digit_count(n):
+    """number of decimal digits of n (of abs(n), and 1 for 0)
+
+    >>> [digit_count(x) for x in (0, 9, 10, -99, 10 ** 100 - 1, 10 ** 100)]
+    [1, 1, 2, 2, 100, 101]"""
+    n = abs(n)
+    # n >= 2 ** (bits - 1), so it has at least this many digits, and at most one more
+    # (the float product is lowered a little so the estimate is never too high)
+    d = max(int((n.bit_length() - 1) * LOG10_2 - 1e-9) + 1, 1)
+    while n >= pow10(d):
+        d += 1
+    return d
+
+
+def decimal(n):
+    """ascii decimal digits of a non-negative int, of any size
+
+    >>> decimal(2 ** 100)
+    b'1267650600228229401496703205376'
+    >>> len(decimal(10 ** 5000)), decimal(10 ** 5000 + 7)[-3:]
+    (5001, b'007')"""
+    if n < 0:
+        raise ValueError('n must be non-negative')
+    pieces = []
+    _decimal(n, 0, pieces)
+    return b''.join(pieces)
+
+
+def _decimal(n, width, pieces):
+    # append the digits of n, left padded with zeros to width
+    d = digit_count(n)
+    if d <= SMALL:
+        pieces.append(str(n).encode().rjust(width, b'0'))
+        return
+    if width > d:
+        pieces.append(b'0' * (width - d))
+    # split at the largest power of two below the length, so the divisors are shared
+    e = 1 << ((d - 1).bit_length() - 1)
+    high, low = divmod(n, pow10(e))
+    _decimal(high, 0, pieces)
+    _decimal(low, e, pieces)
+
+
+def digit_sum(n):
+    """sum of the decimal digits of abs(n)
+
+    >>> digit_sum(2 ** 15), digit_sum(-1234)
+    (26, 10)
+    >>> digit_sum(10 ** 5000 - 1)
+    45000"""
+    digits = decimal(abs(n))
+    return sum(d * digits.count(48 + d) for d in range(1, 10))
+
+
+def powers(a, b_max, start=1):
+    """generator yielding a ** start, a ** (start + 1), ... a ** b_max, each by one multiplication
+
+    >>> list(powers(3, 5))
+    [3, 9, 27, 81, 243]"""
+    x = a ** start
+    for _ in range(start, b_max + 1):
+        yield x
+        x *= a
+
+
+@lru_cache()
+def _limb_digit_sums():
+    import numpy as np
+    sums = np.zeros(1, dtype=np.int64)
+    for _ in range(6):
+        sums = (sums[:, None] + np.arange(10)).ravel()
+    return sums.astype(np.uint8)
+
+
+def power_digit_sums(bases, b_max):
+    """array of shape (len(bases), b_max), digit sums of a ** b for b = 1 .. b_max
+
+    All the powers are held as columns of base 10**6 limbs and multiplied by
+    their bases together, so each step costs a few numpy passes and a table
+    lookup per limb instead of a conversion per power.  Bases must be below
+    2**30.
+
+    >>> power_digit_sums([2, 10, 99], 3).tolist()
+    [[2, 4, 8], [1, 1, 1], [18, 18, 36]]
+    >>> int(power_digit_sums(range(1, 100), 99).max())
+    972"""
+    import numpy as np
+    bases = np.asarray(bases, dtype=np.int64)
+    if not len(bases):
+        return np.zeros((0, b_max), dtype=np.int64)
+    if bases.min() < 1 or bases.max() >= 2 ** 30:
+        raise ValueError('bases must be positive and below 2**30')
+    table = _limb_digit_sums()
+    top = int(bases.max())
+    # a ** b < 2 ** (b * bits) < 10 ** (b * bits * 0.302), and a limb holds 6 digits
+    limbs = -(-b_max * top.bit_length() * 151 // 3000) + 2
+    # one column per base, so that the limbs in use are a contiguous block of rows
+    x = np.zeros((limbs, len(bases)), dtype=np.int64)
+    x[0] = 1
+    out = np.empty((len(bases), b_max), dtype=np.int64)
+    for b in range(b_max):
+        # limbs in use, with room for the product to carry into
+        used = min(-(-(b + 1) * top.bit_length() * 151 // 3000) + 2, limbs)
+        live = x[:used]
+        live *= bases
+        # live < 2 ** 50, so the float quotient is within 2 ** -22 of the true one,
+        # whose fractional part is a multiple of 10 ** -6: nudged by half of that it floors exactly
+        carry = (live * 1e-6 + 5e-7).astype(np.int64)
+        live -= carry * 10 ** 6
+        live[1:] += carry[:-1]
+        # the carries push only a few limbs over again, fix those one by one
+        while True:
+            rows, cols = np.nonzero(live >= 10 ** 6)
+            if not len(rows):
+                break
+            carry = live[rows, cols] // 10 ** 6
+            live[rows, cols] -= carry * 10 ** 6
+            live[rows + 1, cols] += carry
+        out[:, b] = table[live].sum(axis=0, dtype=np.int64)
+    return out
@@ -0,0 +1,121 @@
+"""
+s-gonal numbers: triangle (s=3), square, pentagonal, hexagonal (s=6), ...
+
+Membership and positions are computed from the index formula with integer
+square roots, so families are never materialized: common members of several
+families are found by testing the sparsest one against the others (p045), and
+pairs with polygonal sums and differences are tested in vectorized blocks
+(p044).
+"""
+from math import isqrt
+
+
+def polygonal(s, n):
+    """the nth s-gonal number
+
+    >>> [polygonal(3, n) for n in range(1, 6)], [polygonal(5, n) for n in range(1, 6)]
+    ([1, 3, 6, 10, 15], [1, 5, 12, 22, 35])"""
+    return ((s - 2) * n * n - (s - 4) * n) // 2
+
+
+def polygonals(s, start=1):
+    """generator yielding the s-gonal numbers, from the index start"""
+    n = start
+    while True:
+        yield polygonal(s, n)
+        n += 1
+
+
+def _root(s, x):
+    # largest n with polygonal(s, n) <= x, together with whether that is an equality
+    # polygonal(s, n) = x  <=>  (2 (s-2) n - (s-4))^2 = 8 (s-2) x + (s-4)^2
+    disc = 8 * (s - 2) * x + (s - 4) ** 2
+    r = isqrt(disc)
+    n = (r + s - 4) // (2 * (s - 2))
+    return n, r * r == disc and (r + s - 4) % (2 * (s - 2)) == 0
+
+
+def polygonal_index(s, x):
+    """n such that x is the nth s-gonal number, or None
+
+    >>> polygonal_index(6, 40755), polygonal_index(6, 40756)
+    (143, None)"""
+    if x < 1:
+        return None
+    n, exact = _root(s, x)
+    return n if exact else None
+
+
+def is_polygonal(s, x):
+    """
+    >>> [x for x in range(40) if is_polygonal(5, x)]
+    [1, 5, 12, 22, 35]"""
+    return polygonal_index(s, x) is not None
+
+
+def _is_polygonal_array(s, x):
+    import numpy as np
+    disc = 8 * (s - 2) * x + (s - 4) ** 2
+    r = np.sqrt(disc.astype(np.float64)).astype(np.int64)
+    # correct the float root by one either way
+    r -= r * r > disc
+    r += (r + 1) * (r + 1) <= disc
+    return (x >= 1) & (r * r == disc) & ((r + s - 4) % (2 * (s - 2)) == 0)
+
+
+def common_polygonals(*sides, start=1, block=1 << 16):
+    """generator yielding the numbers >= start which are s-gonal for every s in sides
+
+    The sparsest family (the largest s) is walked in vectorized blocks, and its
+    members are tested against the others with integer square roots.  Once
+    the values no longer fit in int64 the test goes on in python ints.
+
+    >>> gen = common_polygonals(3, 5, 6)
+    >>> [next(gen) for _ in range(3)]
+    [1, 40755, 1533776805]
+    >>> next(common_polygonals(3, 4, start=2))
+    36"""
+    import numpy as np
+    if not sides:
+        raise ValueError('at least one family is needed')
+    driver = max(sides)
+    others = sorted(set(sides) - {driver})
+    n, exact = _root(driver, max(start, 1))
+    n = max(n if exact else n + 1, 1)
+    # largest value for which 8 (s-2) x + (s-4)^2, and the squared roots, fit in int64
+    limit = 2 ** 62 // (8 * (max(sides) - 2) + 1)
+    while polygonal(driver, n + block) < limit:
+        index = np.arange(n, n + block, dtype=np.int64)
+        values = ((driver - 2) * index * index - (driver - 4) * index) // 2
+        keep = np.ones(block, dtype=bool)
+        for s in others:
+            keep &= _is_polygonal_array(s, values)
+        yield from values[keep].tolist()
+        n += block
+    while True:
+        x = polygonal(driver, n)
+        if all(is_polygonal(s, x) for s in others):
+            yield x
+        n += 1
+
+
+def sum_difference_pairs(s=5, block=1 << 16):
+    """generator yielding (j, k), j < k, whenever the jth and kth s-gonal numbers have
+    an s-gonal sum and difference, ordered by k and then j
+
+    For each k all j < k are tested at once, in blocks of at most `block`, so no
+    list of smaller s-gonal numbers is ever built.
+
+    >>> next(sum_difference_pairs(5))
+    (1020, 2167)"""
+    import numpy as np
+    k = 2
+    while True:
+        pk = polygonal(s, k)
+        for lo in range(1, k, block):
+            j = np.arange(lo, min(lo + block, k), dtype=np.int64)
+            pj = ((s - 2) * j * j - (s - 4) * j) // 2
+            hits = j[_is_polygonal_array(s, pk - pj) & _is_polygonal_array(s, pk + pj)]
+            for hit in hits.tolist():
+                yield hit, k
+        k += 1
@@ -0,0 +1,157 @@
+"""
+reverse-and-add chains and Lychrel numbers (p055)
+
+Numbers are reversed arithmetically, a chunk of digits at a time through a
+lookup table.  Chains are walked once: every value met gets its number of
+steps to a palindrome cached (or a lower bound on it, for chains that run
+out of iterations), so seeds which flow into a known chain stop there.  n
+and its reverse share their whole chain after the first step.
+
+Whole ranges of seeds are classified with numpy while the chain values fit
+in int64, and only the few long chains are finished in python ints.
+"""
+from functools import lru_cache
+from itertools import islice
+
+CHUNK = 4
+
+
+@lru_cache()
+def _tables(base):
+    size = base ** CHUNK
+    padded, short = [], []
+    for n in range(size):
+        digits = []
+        while n:
+            n, d = divmod(n, base)
+            digits.append(d)
+        value = 0
+        for d in digits:
+            value = value * base + d
+        padded.append(value * base ** (CHUNK - len(digits)))
+        short.append((value, base ** len(digits)))
+    return size, padded, short
+
+
+def reverse(n, base=10):
+    """the digits of n >= 0 in reverse order
+
+    >>> reverse(1292), reverse(4994), reverse(1200), reverse(0b1011, base=2)
+    (2921, 4994, 21, 13)"""
+    size, padded, short = _tables(base)
+    r = 0
+    while n >= size:
+        n, chunk = divmod(n, size)
+        r = r * size + padded[chunk]
+    value, scale = short[n]
+    return r * scale + value
+
+
+class Lychrel:
+
+    """reverse-and-add chains, with a cache shared by all the chains walked
+
+    The cache never holds more than cache_size values: past that the oldest
+    are dropped, including the far end of a chain longer than the whole cache.
+
+    >>> lychrel = Lychrel()
+    >>> lychrel.steps(47), lychrel.steps(349), lychrel.steps(10677, budget=60)
+    (1, 3, 53)
+    >>> lychrel.is_lychrel(196), lychrel.is_lychrel(4994), lychrel.is_lychrel(10677)
+    (True, True, True)
+    >>> int(lychrel.classify(0, 10000).sum())
+    249"""
+
+    def __init__(self, iterations=50, base=10, cache_size=1 << 20):
+        self.iterations = iterations
+        self.base = base
+        self.cache_size = cache_size
+        # value -> steps to a palindrome, or -k if it is only known to take at least k
+        self.cache = {}
+
+    def _store(self, items):
+        cache = self.cache
+        cache.update(items)
+        excess = len(cache) - self.cache_size
+        if excess > 0:
+            # drop the oldest entries, and another quarter of the cache so that this is not
+            # done for every chain; entries are independent, so any of them can go
+            for key in list(islice(cache, min(excess + self.cache_size // 4, len(cache)))):
+                del cache[key]
+
+    def steps(self, n, budget=None):
+        """number of reverse-and-add steps from n to a palindrome, or None if more than budget
+        (by default the number of iterations)"""
+        if budget is None:
+            budget = self.iterations
+        base, cache = self.base, self.cache
+        chain = [n]
+        r = reverse(n, base)
+        while True:
+            v = chain[-1]
+            known = cache.get(v)
+            if known is not None and known > 0:
+                exact = known
+                break
+            lower = -known if known else 1
+            if lower + len(chain) - 1 > budget:
+                exact = None
+                break
+            s = v + r
+            r = reverse(s, base)
+            if s == r:
+                exact = 1
+                break
+            chain.append(s)
+        if exact is None:
+            self._store({v: -(lower + i) for i, v in enumerate(reversed(chain))})
+            return None
+        self._store({v: exact + i for i, v in enumerate(reversed(chain))})
+        total = exact + len(chain) - 1
+        return total if total <= budget else None
+
+    def is_lychrel(self, n):
+        """n does not reach a palindrome within the allowed iterations"""
+        return self.steps(n) is None
+
+    def classify(self, start, stop, block=1 << 20):
+        """boolean array, is_lychrel for each of the seeds range(start, stop)"""
+        import numpy as np
+        size, padded, short = _tables(self.base)
+        padded = np.array(padded, dtype=np.int64)
+        short_value = np.array([v for v, _ in short], dtype=np.int64)
+        short_scale = np.array([s for _, s in short], dtype=np.int64)
+        # sums and their reverses stay below this power of the base
+        limit = 1
+        while limit * self.base < 2 ** 62:
+            limit *= self.base
+
+        def reverse_array(values):
+            r = np.zeros_like(values)
+            while True:
+                big = values >= size
+                if not big.any():
+                    return r * short_scale[values] + short_value[values]
+                chunk = values % size
+                r = np.where(big, r * size + padded[chunk], r)
+                values = np.where(big, values // size, values)
+
+        result = np.zeros(stop - start, dtype=bool)
+        for lo in range(start, stop, block):
+            seeds = np.arange(lo, min(lo + block, stop), dtype=np.int64)
+            values, r = seeds, reverse_array(seeds)
+            for step in range(1, self.iterations + 1):
+                s = values + r
+                r = reverse_array(s)
+                going = s != r
+                # hand the values which might overflow over to python ints
+                large = going & (s >= limit // self.base)
+                if large.any():
+                    # seeds often meet, so many of them hand over the same value
+                    escaped, inverse = np.unique(s[large], return_inverse=True)
+                    verdicts = [self.steps(v, self.iterations - step) is None for v in escaped.tolist()]
+                    result[seeds[large] - start] = np.array(verdicts)[inverse]
+                going &= ~large
+                seeds, values, r = seeds[going], s[going], r[going]
+            result[seeds - start] = True
+        return result
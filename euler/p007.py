@@ -3,11 +3,6 @@ By listing the first six prime numbers: 2, 3, 5, 7, 11, and 13, we can see that
 
 What is the 10 001st prime number?
 """
-from euler import primes
+from euler import sieve
 
-bound = 1
-p = primes(bound)
-while len(p) < 10001:
-    bound *= 2
-    p = primes(bound)
-result = p[10000]
+result = sieve.nth(10001)
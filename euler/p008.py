@@ -23,10 +23,8 @@ Find the greatest product of five consecutive digits in the 1000-digit number.
 71636269561882670428252483600823257530420752963450
 """
 import sys
-from functools import reduce
-from operator import mul
+from euler.windows import AsciiDigits, max_product
 
 n_str = ''.join(x.strip() for x in sys.modules[__name__].__doc__.splitlines()[2:])
 assert len(n_str) == 1000
-n_list = [int(x) for x in n_str]
-result = max(reduce(mul, n_list[i:i + 5]) for i in range(1000))
+result = max_product(AsciiDigits(n_str.encode()), 5)
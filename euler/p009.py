@@ -7,11 +7,7 @@ For example, 3^2 + 4^2 = 9 + 16 = 25 = 5^2.
 There exists exactly one Pythagorean triplet for which a + b + c = 1000.
 Find the product abc.
 """
-from itertools import combinations_with_replacement
-
-for a, b in combinations_with_replacement(range(1, 501), 2):
-    c = 1000 - a - b
-    if a ** 2 + b ** 2 == c ** 2:
-        break
+from euler.triples import triples
 
+a, b, c = next(t for t in triples(1000) if sum(t) == 1000)
 result = a * b * c
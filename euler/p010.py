@@ -3,6 +3,6 @@ The sum of the primes below 10 is 2 + 3 + 5 + 7 = 17.
 
 Find the sum of all the primes below two million.
 """
-from euler import primes
+from euler import prime_sum
 
-result = sum(primes(2 * 10 ** 6))
+result = prime_sum(2 * 10 ** 6)
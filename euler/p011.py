@@ -27,15 +27,8 @@ The product of these numbers is 26 * 63 * 78 * 14 = 1788696.
 What is the greatest product of four adjacent numbers in any direction (up, down, left, right, or diagonally) in the 20x20 grid?
 """
 import sys
-from functools import reduce
-from operator import mul
-import numpy as np
+from euler.windows import max_grid_product
 
-a = np.array([[int(x) for x in row.split()] for row in sys.modules[__name__].__doc__.splitlines()[3:-4]])
-assert a.shape == (20, 20)
-n = 4
-verticals = reduce(mul, (a[i:i + a.shape[0] - n + 1, :] for i in range(n)))
-horizontals = reduce(mul, (a[:, i:i + a.shape[1] - n + 1] for i in range(n)))
-diagonals = reduce(mul, (a[i:i + a.shape[0] - n + 1, i:i + a.shape[1] - n + 1] for i in range(n)))
-antidiagonals = reduce(mul, (a[i:i + a.shape[0] - n + 1, n - i - 1:a.shape[1] - i] for i in range(n)))
-result = int(max(verticals.max(), horizontals.max(), diagonals.max(), antidiagonals.max()))
+a = [[int(x) for x in row.split()] for row in sys.modules[__name__].__doc__.splitlines()[3:-4]]
+assert len(a) == len(a[0]) == 20
+result = max_grid_product(a, 4)
@@ -3,4 +3,6 @@
 
 What is the sum of the digits of the number 2^1000?
 """
-result = sum(int(x) for x in str(2 ** 1000))
+from euler.digits import digit_sum
+
+result = digit_sum(2 ** 1000)
@@ -29,13 +29,7 @@ Find the maximum total from top to bottom of the triangle below:
 NOTE: As there are only 16384 routes, it is possible to solve this problem by trying every route. However, Problem 67, is the same challenge with a triangle containing one-hundred rows; it cannot be solved by brute force, and requires a clever method! ;o)
 """
 import sys
+from euler.paths import triangle_max
 
 d = [[int(n) for n in x.split()] for x in sys.modules[__name__].__doc__.splitlines()[12:-2]]
-s = [[0] * len(r) for r in d]
-s[-1][:] = d[-1][:]
-r = len(d) - 2
-while r >= 0:
-    for i in range(r + 1):
-        s[r][i] = d[r][i] + max(s[r + 1][i], s[r + 1][i + 1])
-    r -= 1
-result = s[0][0]
+result = triangle_max(reversed(d))
@@ -7,5 +7,6 @@ and the sum of the digits in the number 10! is 3 + 6 + 2 + 8 + 8 + 0 + 0 = 27.
 Find the sum of the digits in the number 100!
 """
 from math import factorial
+from euler.digits import digit_sum
 
-result = sum(int(x) for x in str(factorial(100)))
+result = digit_sum(factorial(100))
@@ -5,8 +5,7 @@ For example, when the list is sorted into alphabetical order, COLIN, which is wo
 
 What is the total of all the name scores in the file?
 """
-from ast import literal_eval
-from pathlib import Path
+from euler import data
 
-names = sorted(literal_eval(Path('data/p022_names.txt').read_text()))
+names = sorted(data.names())
 result = sum(sum(ord(c) - 64 for c in name) * i for i, name in enumerate(names, 1))
@@ -7,10 +7,8 @@ As 12 is the smallest abundant number, 1 + 2 + 3 + 4 + 6 = 16, the smallest numb
 
 Find the sum of all the positive integers which cannot be written as the sum of two abundant numbers.
 """
-from itertools import combinations_with_replacement
-from euler import divisors
+from euler import divisors, sumset_upto
 
 abundant_numbers = [x for x in range(1, 28124) if sum(divisors(x)[:-1]) > x]
-Ns = set(range(1, 28124))
-ns = {x + y for x, y in combinations_with_replacement(abundant_numbers, 2)}
-result = sum(Ns - ns)
+representable = sumset_upto(abundant_numbers, 28123)
+result = sum(n for n in range(1, 28124) if not representable[n])
@@ -5,6 +5,6 @@ A permutation is an ordered arrangement of objects. For example, 3124 is one pos
 
 What is the millionth lexicographic permutation of the digits 0, 1, 2, 3, 4, 5, 6, 7, 8 and 9?
 """
-from itertools import islice, permutations
+from euler import nth_permutation
 
-result = int(''.join(str(n) for n in next(islice(permutations(range(10)), 10 ** 6 - 1, 10 ** 6))))
+result = int(''.join(str(n) for n in nth_permutation(range(10), 10 ** 6 - 1)))
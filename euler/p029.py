@@ -11,4 +11,6 @@ If they are then placed in numerical order, with any repeats removed, we get the
 
 How many distinct terms are in the sequence generated by ab for 2 <= a <= 100 and 2 <= b <= 100?
 """
-result = len({a ** b for a in range(2, 101) for b in range(2, 101)})
+from euler import count_distinct_powers
+
+result = count_distinct_powers(100, 100)
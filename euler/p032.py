@@ -7,16 +7,6 @@ Find the sum of all products whose multiplicand/multiplier/product identity can
 
 HINT: Some products can be obtained in more than one way so be sure to only include it once in your sum.
 """
-from euler import unique_digits
+from euler.pandigital import pandigital_products
 
-pandigital_products = set()
-candidates = [n for n in range(2000) if '0' not in str(n) and unique_digits(n)]
-for k, n in enumerate(candidates):
-    for m in candidates[k:]:
-        s = set(str(n)) & set(str(m))
-        if not s:
-            mn = str(m * n)
-            if '0' not in mn and unique_digits(mn) and set('123456789') - set(str(m) + str(n)) == set(mn):
-                pandigital_products |= {m * n}
-
-result = sum(pandigital_products)
+result = sum({product for _, _, product in pandigital_products()})
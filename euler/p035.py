@@ -5,6 +5,6 @@ There are thirteen such primes below 100: 2, 3, 5, 7, 11, 13, 17, 31, 37, 71, 73
 
 How many circular primes are there below one million?
 """
-from euler import primes, Primes
+from euler.digitprimes import circular_primes
 
-result = sum(1 for p in primes(1000000) if all(int(str(p)[n:] + str(p)[:n]) in Primes for n in range(1, len(str(p)))))
+result = len(circular_primes(6))
@@ -5,17 +5,6 @@ Find the sum of the only eleven primes that are both truncatable from left to ri
 
 NOTE: 2, 3, 5, and 7 are not considered to be truncatable primes.
 """
-from itertools import count
-from euler import Primes
+from euler.digitprimes import truncatable_primes
 
-total = 0
-count_ = 0
-for n in count(11, 2):
-    str_n = str(n)
-    len_n = len(str_n)
-    if n in Primes and all(int(str_n[k:]) in Primes and int(str_n[:k]) in Primes for k in range(1, len_n)):
-        count_ += 1
-        total += n
-        if count_ == 11:
-            result = total
-            break
+result = sum(truncatable_primes())
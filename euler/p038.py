@@ -10,20 +10,6 @@ The same can be achieved by starting with 9 and multiplying by 1, 2, 3, 4, and 5
 
 What is the largest 1 to 9 pandigital 9-digit number that can be formed as the concatenated product of an integer with (1,2, ... , n) where n > 1?
 """
-from itertools import count
-from euler import unique_digits
+from euler.pandigital import concatenated_products
 
-largest = 918273645
-for m in range(91, 10000):
-    s = str(m) + str(2 * m)
-    if '0' in s or not unique_digits(s):
-        continue
-    for n in count(3):
-        s_ = str(n * m)
-        if '0' in s_ or not unique_digits(s_ + s):
-            break
-        s += s_
-    if set(s) == set('123456789'):
-        largest = max(int(s), largest)
-
-result = largest
+result = max(value for value, _, _ in concatenated_products())
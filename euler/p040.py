@@ -9,13 +9,7 @@ If dn represents the nth digit of the fractional part, find the value of the fol
 
 d1 * d10 * d100 * d1000 * d10000 * d100000 * d1000000
 """
-from functools import reduce
-from itertools import count
-from operator import mul
+import math
+from euler import champernowne_digits
 
-s = '.'
-for i in count(1):
-    s += str(i)
-    if len(s) > 1000000:
-        result = reduce(mul, [int(s[10 ** d]) for d in range(7)], 1)
-        break
+result = math.prod(champernowne_digits([10 ** d for d in range(7)]).tolist())
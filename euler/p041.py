@@ -3,18 +3,17 @@ We shall say that an n-digit number is pandigital if it makes use of all the dig
 
 What is the largest n-digit pandigital prime that exists?
 """
-from itertools import permutations
-from euler import is_prime
+from euler import miller_rabin
+from euler.pandigital import pandigitals
 
 
 def f():
-    i = 9
-    while i > 0:
-        for t in permutations(''.join(str(d) for d in range(i, 0, -1)), i):
-            n = int(''.join(t))
-            if is_prime(n):
-                return n
-        else:
-            i -= 1
+    for n in range(9, 0, -1):
+        # the digit sum, and so every n-pandigital, is then divisible by 3
+        if n * (n + 1) // 2 % 3 == 0:
+            continue
+        for p in pandigitals(range(1, n + 1), descending=True, last_digits=(1, 3, 7, 9)):
+            if miller_rabin(p):
+                return p
 
 result = f()
@@ -7,11 +7,9 @@ By converting each letter in a word to a number corresponding to its alphabetica
 
 Using p042_words.txt (right click and 'Save Link/Target As...'), a 16K text file containing nearly two-thousand common English words, how many are triangle words?
 """
-from ast import literal_eval
 from itertools import takewhile
-from pathlib import Path
-from euler import triangles
+from euler import data, triangles
 
-words = literal_eval(Path('data/p042_words.txt').read_text())
+words = data.words()
 tri = set(takewhile((len(max(words, key=len))*26).__gt__, triangles()))
 result = sum(1 for word in words if sum(ord(c)-64 for c in word) in tri)
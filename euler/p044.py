@@ -7,15 +7,7 @@ It can be seen that P4 + P7 = 22 + 70 = 92 = P8. However, their difference, 70 -
 
 Find the pair of pentagonal numbers, Pj and Pk, for which their sum and difference are pentagonal and D = |Pk - Pj| is minimised; what is the value of D?
 """
-from itertools import count
-from euler import pentagonal, Pentagonals
+from euler.figurate import polygonal, sum_difference_pairs
 
-def f():
-    for n in count(1):
-        pn = pentagonal(n)
-        lower_pentagonals = [pentagonal(i) for i in range(1, n)]
-        for p in lower_pentagonals:
-            if pn - p in Pentagonals and pn + p in Pentagonals:
-                return pn - p
-
-result = f()
+j, k = next(sum_difference_pairs(5))
+result = polygonal(5, k) - polygonal(5, j)
@@ -8,10 +8,6 @@ It can be verified that T285 = P165 = H143 = 40755.
 
 Find the next triangle number that is also pentagonal and hexagonal.
 """
-from itertools import count
-from euler import triangle, Hexagonals, Pentagonals
+from euler.figurate import common_polygonals
 
-for n in count(285 + 1):
-    result = triangle(n)
-    if result in Pentagonals and result in Hexagonals:
-         break
+result = next(common_polygonals(3, 5, 6, start=40755 + 1))
@@ -12,24 +12,14 @@ It turns out that the conjecture was false.
 
 What is the smallest odd composite that cannot be written as the sum of a prime and twice a square?
 """
-import numpy as np
 from itertools import count
-from euler import primes
+from math import isqrt
+from euler import sieve
 
-bound = 10
-while True:
-    candidates = np.ones(bound, dtype=bool)
-    # strike out the evens, and the trivial solution
-    candidates[::2] = False
-    candidates[1] = False
-    for p in primes(bound):
-        for i in count():
-            try:
-                candidates[p + 2 * i * i] = False
-            except IndexError:
-                break
-    if any(candidates):
-        result = int(candidates.argmax())
-        break
-    else:
-        bound *= 2
+
+def f():
+    for n in count(9, 2):
+        if n not in sieve and not any(n - 2 * i * i in sieve for i in range(1, isqrt(n // 2) + 1)):
+            return n
+
+result = f()
@@ -12,10 +12,6 @@ The first three consecutive numbers to have three distinct prime factors are:
 
 Find the first four consecutive integers to have four distinct prime factors. What is the first of these numbers?
 """
-from itertools import count
-from euler import factorise
+from euler import consecutive_distinct_factors
 
-n = 4
-for result in count():
-    if all(len(set(factorise(result + k))) == n for k in range(n)):
-        break
+result = consecutive_distinct_factors(4)
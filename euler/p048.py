@@ -3,4 +3,6 @@ The series, 1^1 + 2^2 + 3^3 + ... + 10^10 = 10405071317.
 
 Find the last ten digits of the series, 1^1 + 2^2 + 3^3 + ... + 1000^1000.
 """
-result = int(str(sum(i ** i for i in range(1, 1001)))[-10:])
+from euler import self_power_sum_mod
+
+result = self_power_sum_mod(1000, 10 ** 10)
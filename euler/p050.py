@@ -8,26 +8,6 @@ The longest sum of consecutive primes below one-thousand that adds to a prime, c
 
 Which prime, below one-million, can be written as the sum of the most consecutive primes?
 """
-from itertools import count
-from euler import primes
+from euler import PrimeTable
 
-p = primes(10 ** 6)
-set_p = set(p)
-
-
-def f():
-    # first find an upper bound on n
-    n = 1
-    while sum(p[:n]) < 10 ** 6:
-        n += 1
-    while True:
-        for i in count():
-            sum_p = sum(p[i:n + i])
-            if sum_p < 10 ** 6:
-                if sum_p in set_p:
-                    return sum_p
-            else:
-                break
-        n -= 1
-
-result = f()
+result, _, _ = PrimeTable(10 ** 6).longest_prime_window(10 ** 6)
@@ -17,14 +17,6 @@ How many Lychrel numbers are there below ten-thousand?
 
 NOTE: Wording was modified slightly on 24 April 2007 to emphasise the theoretical nature of Lychrel numbers.
 """
-from euler import palindrome
+from euler.lychrel import Lychrel
 
-
-result = 0
-for n in range(10000):
-    for _ in range(50):
-        n = n + int(str(n)[::-1])
-        if palindrome(n):
-            break
-    else:
-        result += 1
+result = int(Lychrel(iterations=50).classify(0, 10000).sum())
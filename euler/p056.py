@@ -3,4 +3,6 @@ A googol (10^100) is a massive number: one followed by one-hundred zeros; 100^10
 
 Considering natural numbers of the form, a^b, where a, b < 100, what is the maximum digital sum?
 """
-result = max(sum(int(x) for x in str(a**b)) for a in range(100) for b in range(a))
+from euler.digits import power_digit_sums
+
+result = int(power_digit_sums(range(1, 100), 99).max())
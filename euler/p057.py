@@ -14,9 +14,7 @@ The next three expansions are 99/70, 239/169, and 577/408, but the eighth expans
 
 In the first one-thousand expansions, how many fractions contain a numerator with more digits than denominator?
 """
-a, b, count = 3, 2, 0
-for _ in range(1000):
-    a, b = a + 2*b, a + b
-    if len(str(a)) > len(str(b)):
-        count += 1
-result = count
+from itertools import islice
+from euler.contfrac import convergents, sqrt_terms
+
+result = sum(c.p_digits > c.q_digits for c in islice(convergents(sqrt_terms(2)), 1, 1001))
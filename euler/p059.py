@@ -9,25 +9,10 @@ Unfortunately, this method is impractical for most users, so the modified method
 
 Your task has been made easy, as the encryption key consists of three lower case characters. Using cipher.txt (right click and 'Save Link/Target As...'), a file containing the encrypted ASCII codes, and the knowledge that the plain text must contain common English words, decrypt the message and find the sum of the ASCII values in the original text.
 """
-from ast import literal_eval
-from collections import Counter
-from itertools import cycle
-from pathlib import Path
+from string import ascii_lowercase
+from euler import data
+from euler.xor import crack_key, xor_decrypt
 
-
-def decrypt(cipher, key):
-    decoded = (x ^ ord(k) for x, k in zip(cipher, cycle(key)))
-    text = ''.join(chr(x) for x in decoded)
-    return text
-
-
-cipher = Path(__file__).parent.parent / 'data' / 'p059_cipher.txt'
-numbers = literal_eval(cipher.read_text())
-[(d0, _)] = Counter(numbers[0::3]).most_common(1)
-[(d1, _)] = Counter(numbers[1::3]).most_common(1)
-[(d2, _)] = Counter(numbers[2::3]).most_common(1)
-key = "".join(chr(d ^ ord(" ")) for d in (d0, d1, d2))
-
-txt = decrypt(numbers, key)
-print(txt)
-print(sum(ord(c) for c in txt))
+cipher = data.cipher()
+key = crack_key(cipher, key_length=3, candidates=ascii_lowercase.encode())
+result = int(xor_decrypt(cipher, key).sum())
@@ -0,0 +1,138 @@
+"""
+pandigital numbers, products and concatenations (p032, p038, p041, p043)
+
+Digits in use are tracked as a bitmask (bit d set when digit d is taken), so
+checking a number for repeated or missing digits never goes through str.
+Numbers are grown a digit at a time from the left, and constraints are
+checked on every prefix, so whole subtrees are pruned as early as possible.
+"""
+
+
+def digit_mask(n, base=10):
+    """bitmask of the digits of n >= 0, or None if a digit repeats
+
+    >>> bin(digit_mask(7254)), digit_mask(1233)
+    ('0b10110100', None)"""
+    mask = 0
+    while True:
+        n, d = divmod(n, base)
+        if mask >> d & 1:
+            return None
+        mask |= 1 << d
+        if not n:
+            return mask
+
+
+def mask_of(digits):
+    """bitmask of an iterable of digits"""
+    mask = 0
+    for d in digits:
+        mask |= 1 << d
+    return mask
+
+
+def arrangements(digits, k, base=10, constraint=None, descending=False, last_digits=None):
+    """generator yielding (value, mask) for the k-digit numbers made of distinct digits taken from
+    digits, without a leading zero, in increasing (or decreasing) order
+
+    constraint(prefix, length), if given, is called for every prefix and prunes
+    the prefixes for which it is false.  last_digits restricts the final digit,
+    and prunes prefixes which leave none of them available.
+
+    >>> [v for v, _ in arrangements([0, 1, 2], 2)]
+    [10, 12, 20, 21]"""
+    digits = sorted(set(digits), reverse=descending)
+    last = mask_of(digits if last_digits is None else last_digits)
+    full = mask_of(digits)
+
+    def extend(value, used, length):
+        if length == k:
+            yield value, used
+            return
+        for d in digits:
+            bit = 1 << d
+            if used & bit or (d == 0 and length == 0 and k > 1):
+                continue
+            if length == k - 1:
+                if not bit & last:
+                    continue
+            elif not full & ~(used | bit) & last:
+                continue
+            prefix = value * base + d
+            if constraint is None or constraint(prefix, length + 1):
+                yield from extend(prefix, used | bit, length + 1)
+
+    if 0 <= k <= len(digits):
+        yield from extend(0, 0, 0)
+
+
+def pandigitals(digits, base=10, constraint=None, descending=False, last_digits=None):
+    """generator yielding the numbers using each of digits exactly once (see arrangements)
+
+    >>> list(pandigitals(range(1, 4)))
+    [123, 132, 213, 231, 312, 321]
+    >>> next(pandigitals(range(1, 5), descending=True, last_digits=[2]))
+    4312"""
+    digits = list(digits)
+    return (value for value, _ in arrangements(digits, len(set(digits)), base, constraint, descending, last_digits))
+
+
+def substring_divisibility(divisors, width=3, start=2, base=10):
+    """prefix constraint: the width digits from position start + i (counting from 1) are divisible by divisors[i]
+
+    >>> sum(pandigitals(range(10), constraint=substring_divisibility([2, 3, 5, 7, 11, 13, 17])))
+    16695334890"""
+    divisors = list(divisors)
+    window = base ** width
+
+    def constraint(prefix, length):
+        i = length - start - width + 1
+        return not 0 <= i < len(divisors) or prefix % window % divisors[i] == 0
+    return constraint
+
+
+def pandigital_products(digits=range(1, 10), base=10):
+    """generator yielding (a, b, a * b), a < b, such that a, b and a * b together use each of digits once
+
+    >>> next(pandigital_products())
+    (4, 1738, 6952)"""
+    digits = list(digits)
+    full = mask_of(digits)
+    n = bin(full).count('1')
+    for ka in range(1, n):
+        for kb in range(ka, n - ka):
+            # a product of ka and kb digit numbers has ka + kb - 1 or ka + kb digits
+            if n - ka - kb not in (ka + kb - 1, ka + kb):
+                continue
+            for a, ma in arrangements(digits, ka, base):
+                for b, mb in arrangements([d for d in digits if not ma >> d & 1], kb, base):
+                    if ka == kb and b <= a:
+                        continue
+                    if digit_mask(a * b, base) == full & ~(ma | mb):
+                        yield a, b, a * b
+
+
+def concatenated_products(digits=range(1, 10), base=10):
+    """generator yielding (value, m, k), k > 1, where value is m * 1, m * 2, ... m * k written one after
+    another and uses each of digits once
+
+    >>> max(concatenated_products())
+    (932718654, 9327, 2)"""
+    full = mask_of(digits)
+    n = bin(full).count('1')
+    for m in range(1, base ** (n // 2)):
+        value, used = 0, 0
+        for k in range(1, n + 1):
+            part = m * k
+            mask = digit_mask(part, base)
+            if mask is None or mask & used or mask & ~full:
+                break
+            while part:
+                value *= base
+                part //= base
+            value += m * k
+            used |= mask
+            if used == full:
+                if k > 1:
+                    yield value, m, k
+                break
@@ -0,0 +1,61 @@
+"""
+maximum path sums through number triangles (p018, p067)
+
+The triangle is reduced bottom-up, one row at a time, so only a single row
+buffer is ever held: rows can be streamed from a generator, or read from the
+end of a file.
+"""
+import mmap
+
+
+def triangle_max(rows, path=False):
+    """maximum total from top to bottom of a number triangle, given its rows bottom-up
+
+    With path=True also returns the column taken in each row, top row first.
+    That keeps one bit per entry of the triangle, packed eight to a byte;
+    everything else is O(width).
+
+    >>> triangle_max([[8, 5, 9, 3], [2, 4, 6], [7, 4], [3]])
+    23
+    >>> triangle_max(reversed([[3], [7, 4], [2, 4, 6], [8, 5, 9, 3]]), path=True)
+    (23, [0, 0, 1, 2])"""
+    import numpy as np
+    best = None
+    choices = []
+    for row in rows:
+        row = np.asarray(row, dtype=np.int64)
+        if best is None:
+            best = row.copy()
+            continue
+        if len(row) != len(best) - 1:
+            raise ValueError('each row must be one shorter than the row below it')
+        if path:
+            choices.append(np.packbits(best[1:] > best[:-1]))
+        np.maximum(best[:-1], best[1:], out=best[:-1])
+        best = best[:-1]
+        best += row
+    if best is None or len(best) != 1:
+        raise ValueError('the top row of a triangle has one entry')
+    total = int(best[0])
+    if not path:
+        return total
+    columns = [0]
+    for right in reversed(choices):
+        c = columns[-1]
+        columns.append(c + (int(right[c >> 3]) >> (7 - (c & 7)) & 1))
+    return total, columns
+
+
+def rows_bottom_up(filename):
+    """rows of a whitespace separated triangle file, read from the end of the file backwards
+
+    Each line is parsed by numpy in one call, not a token at a time."""
+    import numpy as np
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        end = len(m)
+        while end > 0:
+            start = m.rfind(b'\n', 0, end) + 1
+            line = m[start:end]
+            if line.strip():
+                yield np.fromstring(line, dtype=np.int64, sep=' ')
+            end = start - 1
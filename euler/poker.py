@@ -0,0 +1,162 @@
+"""
+table driven 5-card poker hand evaluator
+
+A card is encoded as the integer 4 * rank + suit, with ranks 0-12 for 2-A and
+suits 0-3 for CDHS.  Every hand is scored as one integer, category in the top
+bits and then the ranks ordered by multiplicity and value, one nibble each, so
+that comparing scores compares hands with all kickers taken into account.
+
+All 7462 distinct hands are scored once, on first use.  Hands with five distinct
+ranks are looked up by their 13-bit rank mask (one table for flushes, one for
+the rest) and hands with a repeated rank by the product of one prime per rank,
+which is unique to the multiset of ranks.
+"""
+from collections import Counter
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from math import prod
+
+RANKS = '23456789TJQKA'
+SUITS = 'CDHS'
+CATEGORIES = ('High Card', 'One Pair', 'Two Pairs', 'Three of a Kind', 'Straight',
+              'Flush', 'Full House', 'Four of a Kind', 'Straight Flush')
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def encode(cards):
+    """'5H 5C 6S' -> [13, 12, 19]"""
+    try:
+        return [4 * RANKS.index(c[0]) + SUITS.index(c[1]) for c in cards.split()]
+    except (ValueError, IndexError):
+        raise ValueError('Could not parse cards: {}'.format(cards))
+
+
+def _score(ranks, flush):
+    counts = Counter(ranks)
+    ordered = sorted(counts, key=lambda r: (counts[r], r), reverse=True)
+    shape = sorted(counts.values(), reverse=True)
+    straight = len(counts) == 5 and (ordered[0] - ordered[-1] == 4 or ordered == [12, 3, 2, 1, 0])
+    if straight and ordered[0] == 12 and ordered[1] == 3:
+        ordered = [3, 2, 1, 0, -1]  # the wheel, A2345, is a five-high straight
+    if straight and flush:
+        category = 8
+    elif shape[0] == 4:
+        category = 7
+    elif shape == [3, 2]:
+        category = 6
+    elif flush:
+        category = 5
+    elif straight:
+        category = 4
+    elif shape[0] == 3:
+        category = 3
+    elif shape == [2, 2, 1]:
+        category = 2
+    elif shape[0] == 2:
+        category = 1
+    else:
+        category = 0
+    score = category
+    for r in ordered + [-1] * (5 - len(ordered)):
+        score = 16 * score + r + 1
+    return score
+
+
+@lru_cache()
+def _tables():
+    flush, unique, paired = [0] * 8192, [0] * 8192, {}
+    for ranks in combinations_with_replacement(range(13), 5):
+        if max(Counter(ranks).values()) > 4:
+            continue
+        if len(set(ranks)) == 5:
+            mask = sum(1 << r for r in ranks)
+            flush[mask] = _score(ranks, flush=True)
+            unique[mask] = _score(ranks, flush=False)
+        else:
+            paired[prod(PRIMES[r] for r in ranks)] = _score(ranks, flush=False)
+    return flush, unique, paired
+
+
+def score(cards):
+    """comparable score of a hand, given as a string or as encoded cards
+
+    >>> score('5H 5C 6S 7S KD') < score('2C 3S 8S 8D TD')
+    True
+    >>> score('4D 6S 9H QH QC') > score('3D 6D 7H QD QS')
+    True
+    >>> score('2H 2D 4C 4D 4S') > score('3C 3D 3S 9S 9D')
+    True
+    >>> score('AH 2D 3C 4D 5S') < score('2H 3D 4C 5D 6S')
+    True
+    >>> category(score('TH JH QH KH AH'))
+    'Straight Flush'"""
+    if isinstance(cards, str):
+        cards = encode(cards)
+    if len(cards) != 5:
+        raise ValueError('Could not parse hand: {}'.format(cards))
+    flush_table, unique_table, paired_table = _tables()
+    mask = 0
+    for c in cards:
+        mask |= 1 << (c >> 2)
+    if unique_table[mask]:
+        flush = len({c & 3 for c in cards}) == 1
+        return flush_table[mask] if flush else unique_table[mask]
+    return paired_table[prod(PRIMES[c >> 2] for c in cards)]
+
+
+def category(score):
+    """name of the category of a scored hand"""
+    return CATEGORIES[score >> 20]
+
+
+def parse_cards(raw):
+    """bytes of whitespace separated cards -> uint8 array of encoded cards"""
+    import numpy as np
+    lookup = np.full((256, 256), 255, dtype=np.uint8)
+    for r, rank in enumerate(RANKS.encode()):
+        for s, suit in enumerate(SUITS.encode()):
+            lookup[rank, suit] = 4 * r + s
+    pairs = np.frombuffer(bytes(raw).translate(None, b' \t\r\n'), dtype=np.uint8).reshape(-1, 2)
+    cards = lookup[pairs[:, 0], pairs[:, 1]]
+    if (cards == 255).any():
+        raise ValueError('Could not parse cards')
+    return cards
+
+
+def parse_deals(raw):
+    """p054 format: one row of ten cards per line, five for each player"""
+    return parse_cards(raw).reshape(-1, 10)
+
+
+@lru_cache()
+def _arrays():
+    import numpy as np
+    flush, unique, paired = _tables()
+    keys = sorted(paired)
+    return (np.array(flush, dtype=np.int64), np.array(unique, dtype=np.int64),
+            np.array(keys, dtype=np.int64), np.array([paired[k] for k in keys], dtype=np.int64),
+            np.array(PRIMES, dtype=np.int64))
+
+
+def score_batch(hands):
+    """vectorized score over an array of shape (n, 5) of encoded hands
+
+    >>> import numpy as np
+    >>> hands = np.array([encode('5H 5C 6S 7S KD'), encode('3D 6D 7D TD QD'), encode('AH 2D 3C 4D 5S')])
+    >>> [category(s) for s in score_batch(hands)]
+    ['One Pair', 'Flush', 'Straight']
+    >>> list(score_batch(hands)) == [score(h) for h in hands.tolist()]
+    True"""
+    import numpy as np
+    flush_table, unique_table, paired_keys, paired_values, primes = _arrays()
+    hands = np.asarray(hands)
+    ranks = hands >> 2
+    suits = hands & 3
+    mask = np.bitwise_or.reduce(np.left_shift(1, ranks, dtype=np.int32), axis=1)
+    flush = (suits == suits[:, :1]).all(axis=1)
+    scores = np.where(flush, flush_table[mask], unique_table[mask])
+    paired = scores == 0
+    if paired.any():
+        products = primes[ranks[paired]].prod(axis=1)
+        scores[paired] = paired_values[np.searchsorted(paired_keys, products)]
+    return scores
@@ -0,0 +1,92 @@
+"""
+pythagorean triples by perimeter (p009, p039)
+
+Primitive triples come from Euclid's formula (or equivalently, the Berggren
+tree), so nothing is ever tested for being a square.  Counting the triples
+of every perimeter up to P is a divisor sum over the primitive perimeters,
+done with numpy: small primitive perimeters add to all their multiples with
+one slice each, large ones are added one multiplier at a time.
+"""
+from math import gcd, isqrt
+
+
+def primitive_triples(max_perimeter):
+    """generator yielding the primitive triples (a, b, c), a < b, with a + b + c <= max_perimeter
+
+    From Euclid's formula with m > n > 0 coprime and of opposite parity: the
+    legs are m^2 - n^2 and 2mn and the perimeter is 2m(m + n).
+
+    >>> sorted(primitive_triples(60))
+    [(3, 4, 5), (5, 12, 13), (7, 24, 25), (8, 15, 17)]"""
+    m = 2
+    while 2 * m * (m + 1) <= max_perimeter:
+        for n in range(1 + m % 2, m, 2):
+            if 2 * m * (m + n) > max_perimeter:
+                break
+            if gcd(m, n) == 1:
+                a, b = m * m - n * n, 2 * m * n
+                yield min(a, b), max(a, b), m * m + n * n
+        m += 1
+
+
+def berggren(max_perimeter):
+    """the same triples as primitive_triples, walking the Berggren tree from (3, 4, 5)
+
+    Every child has a larger perimeter than its parent, so the walk stops at
+    the bound.
+
+    >>> sorted(berggren(60)) == sorted(primitive_triples(60))
+    True"""
+    stack = [(3, 4, 5)]
+    while stack:
+        a, b, c = stack.pop()
+        if a + b + c > max_perimeter:
+            continue
+        yield min(a, b), max(a, b), c
+        stack += [
+            (a - 2 * b + 2 * c, 2 * a - b + 2 * c, 2 * a - 2 * b + 3 * c),
+            (a + 2 * b + 2 * c, 2 * a + b + 2 * c, 2 * a + 2 * b + 3 * c),
+            (-a + 2 * b + 2 * c, -2 * a + b + 2 * c, -2 * a + 2 * b + 3 * c),
+        ]
+
+
+def triples(max_perimeter):
+    """generator yielding all the triples (a, b, c), a < b, with a + b + c <= max_perimeter
+
+    >>> [t for t in triples(1000) if sum(t) == 1000]
+    [(200, 375, 425)]"""
+    for a, b, c in primitive_triples(max_perimeter):
+        for k in range(1, max_perimeter // (a + b + c) + 1):
+            yield k * a, k * b, k * c
+
+
+def primitive_perimeters(max_perimeter):
+    """int64 array of the perimeters of the primitive triples, one entry per triple"""
+    import numpy as np
+    chunks = []
+    for m in range(2, isqrt(max_perimeter // 2) + 1):
+        n = np.arange(1 + m % 2, min(m, max_perimeter // (2 * m) - m + 1), 2, dtype=np.int64)
+        n = n[np.gcd(n, m) == 1]
+        chunks.append(2 * m * (m + n))
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+
+def perimeter_counts(max_perimeter):
+    """int64 array, the number of triples with each perimeter 0 .. max_perimeter
+
+    >>> counts = perimeter_counts(1000)
+    >>> int(counts[120]), int(counts.argmax())
+    (3, 840)"""
+    import numpy as np
+    primitive = np.bincount(primitive_perimeters(max_perimeter), minlength=max_perimeter + 1)
+    counts = np.zeros(max_perimeter + 1, dtype=np.int64)
+    perimeters = np.flatnonzero(primitive)
+    split = isqrt(max_perimeter)
+    small, large = perimeters[perimeters <= split], perimeters[perimeters > split]
+    for q in small.tolist():
+        counts[q::q] += primitive[q]
+    # a large perimeter has fewer than sqrt(max_perimeter) multiples in range
+    for k in range(1, max_perimeter // (split + 1) + 1):
+        q = large[:np.searchsorted(large, max_perimeter // k, side='right')]
+        counts[k * q] += primitive[q]
+    return counts
@@ -0,0 +1,203 @@
+"""
+largest products of n adjacent values, in digit streams (p008) and grids (p011)
+
+Products are never recomputed per window.  Windows are compared by their sum
+of logs, which is a difference of two prefix sums, and windows containing a
+zero are counted out by a prefix count of zeros.  Only windows within rounding
+error of the best are multiplied out exactly: together in int64 when their
+products are known to fit, otherwise once per distinct set of values, so long
+runs of equal windows cost no more than one.
+
+Inputs are consumed in slices (1-D) or row by row (grids), so numpy memmaps of
+inputs much larger than memory work, with O(chunk) or O(n * width) memory.
+"""
+import math
+from collections import deque
+
+TOLERANCE = 1e-9
+# windows whose log product is below this are multiplied out in int64
+INT64_LOG = 62 * math.log(2)
+# candidate windows gathered at a time
+BATCH = 1 << 16
+
+
+def _array(values):
+    import numpy as np
+    if isinstance(values, np.ndarray):
+        return values
+    array = np.asarray(values)
+    # ints beyond 64 bits come out as floats, keep them exact
+    return array if array.dtype.kind in 'iu' else np.array(values, dtype=object)
+
+
+def _logs(values):
+    import numpy as np
+    values = np.asarray(values)
+    zeros = values == 0
+    return np.log(np.where(zeros, 1, values).astype(np.float64)), zeros.astype(np.int64)
+
+
+def _prefix(x):
+    import numpy as np
+    return np.concatenate([[0], np.cumsum(x)])
+
+
+class _Best:
+
+    """running maximum of exact window products"""
+
+    def __init__(self):
+        self.value = None
+        self.log = -math.inf
+
+    def offer(self, scores, zero_counts, windows):
+        """windows(ks) is the array of shape (len(ks), n) of the values in the windows at indices ks"""
+        import numpy as np
+        if not len(scores):
+            return
+        if self.value is None:
+            self.value = 0
+        scores = np.where(zero_counts > 0, -np.inf, scores)
+        top = scores.max()
+        if top == -np.inf:
+            return
+        threshold = max(top, self.log) - TOLERANCE * (1 + abs(top))
+        candidates = np.flatnonzero(scores >= threshold)
+        for lo in range(0, len(candidates), BATCH):
+            values = windows(candidates[lo:lo + BATCH])
+            if top < INT64_LOG:
+                product = int(values.astype(np.int64).prod(axis=1).max())
+            elif values.dtype == object:
+                product = max(math.prod(w) for w in {tuple(sorted(w)) for w in values.tolist()})
+            else:
+                # equal windows up to order have equal products: keep one of each, compared as raw bytes
+                values = np.ascontiguousarray(np.sort(values, axis=1))
+                keys = values.view(np.dtype((np.void, values.itemsize * values.shape[1]))).ravel()
+                _, distinct = np.unique(keys, return_index=True)
+                product = max(math.prod(int(x) for x in w) for w in values[distinct])
+            if product > self.value:
+                self.value = product
+                self.log = math.log(product)
+
+
+def max_product(values, n, chunk=1 << 22):
+    """largest product of n consecutive values of a 1-D sequence of non-negative ints
+
+    >>> max_product([3, 0, 4, 5, 1, 9, 2], 2)
+    20
+    >>> max_product([1, 2, 0, 3], 3)
+    0"""
+    import numpy as np
+    best = _Best()
+    offsets = np.arange(n)
+    for start in range(0, max(len(values) - n + 1, 0), chunk):
+        block = _array(values[start:start + chunk + n - 1])
+        logs, zeros = _logs(block)
+        c, z = _prefix(logs), _prefix(zeros)
+        best.offer(c[n:] - c[:-n], z[n:] - z[:-n], lambda ks: block[ks[:, None] + offsets])
+    if best.value is None:
+        raise ValueError('fewer than n values')
+    return best.value
+
+
+class AsciiDigits:
+
+    """the digits of an ascii buffer (e.g. a memory-mapped file) as a sequence of ints, converted per slice
+
+    Whitespace, line breaks included, is skipped; any other byte which is not a
+    digit is an error.  The digits in each block of the buffer are counted up
+    front, so that a slice only reads the blocks it covers.
+
+    >>> digits = AsciiDigits(b'12345\\n67890\\n')
+    >>> len(digits), digits[3:7].tolist(), int(digits[-1])
+    (10, [4, 5, 6, 7], 0)
+    >>> max_product(AsciiDigits(b'123456\\n'), 2)
+    30"""
+
+    def __init__(self, buffer, block=1 << 16):
+        import numpy as np
+        self.raw = np.frombuffer(buffer, dtype=np.uint8)
+        self.block = block
+        whitespace = np.frombuffer(b' \t\n\r\v\f', dtype=np.uint8)
+        counts = []
+        for lo in range(0, len(self.raw), block):
+            chunk = self.raw[lo:lo + block]
+            digits = chunk - ord('0') < 10
+            if not np.isin(chunk[~digits], whitespace).all():
+                raise ValueError('buffer holds bytes which are neither digits nor whitespace')
+            counts.append(int(digits.sum()))
+        # offsets[i] is the number of digits before block i
+        self.offsets = _prefix(np.array(counts, dtype=np.int64))
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    def __getitem__(self, index):
+        import numpy as np
+        if not isinstance(index, slice):
+            i = index + len(self) if index < 0 else index
+            if not 0 <= i < len(self):
+                raise IndexError('digit index out of range')
+            return self[i:i + 1][0]
+        start, stop, step = index.indices(len(self))
+        if start >= stop:
+            return np.zeros(0, dtype=np.uint8)[::step]
+        first = np.searchsorted(self.offsets, start, side='right') - 1
+        last = np.searchsorted(self.offsets, stop)
+        chunk = self.raw[first * self.block:last * self.block] - ord('0')
+        digits = chunk[chunk < 10]
+        skip = start - self.offsets[first]
+        return digits[skip:skip + stop - start][::step]
+
+
+def max_grid_product(grid, n):
+    """largest product of n adjacent values of a 2-D grid, along rows, columns or either diagonal
+
+    >>> max_grid_product([[1, 2, 3], [4, 5, 6], [7, 8, 9]], 2)
+    72
+    >>> max_grid_product([[9, 1, 1], [1, 1, 9], [1, 9, 1]], 2)
+    81
+    >>> max_grid_product([[1, 1, 9], [1, 9, 1], [1, 1, 1]], 2)
+    81"""
+    import numpy as np
+    best = _Best()
+    offsets = np.arange(n)
+    rows = deque(maxlen=n)
+    # prefix sums of logs and zero counts down columns, diagonals and antidiagonals,
+    # for the last n + 1 rows (starting from a virtual row of zeros above the grid)
+    sums = deque(maxlen=n + 1)
+    for row in grid:
+        row = _array(row)
+        width = len(row)
+        logs, zeros = _logs(row)
+        rows.append(row)
+        if not sums:
+            sums.append([np.zeros(width), np.zeros(width, dtype=np.int64)] * 3)
+
+        c, z = _prefix(logs), _prefix(zeros)
+        best.offer(c[n:] - c[:-n], z[n:] - z[:-n], lambda ks: row[ks[:, None] + offsets])
+
+        vl, vz, dl, dz, al, az = sums[-1]
+        sums.append([
+            vl + logs, vz + zeros,
+            np.concatenate([[0], dl[:-1]]) + logs, np.concatenate([[0], dz[:-1]]) + zeros,
+            np.concatenate([al[1:], [0]]) + logs, np.concatenate([az[1:], [0]]) + zeros,
+        ])
+        if len(sums) <= n:
+            continue
+        old, new = sums[0], sums[-1]
+        pad = np.zeros(1)
+        # oldest row first, so window[t] comes from stack[t]
+        stack = np.stack(rows)
+        best.offer(new[0] - old[0], new[1] - old[1], lambda ks: stack[:, ks].T)
+        if width < n:
+            continue
+        best.offer(new[2][n - 1:] - np.concatenate([pad, old[2][:width - n]]),
+                   new[3][n - 1:] - np.concatenate([pad, old[3][:width - n]]),
+                   lambda ks: stack[offsets, ks[:, None] + offsets])
+        best.offer(new[4][:width - n + 1] - np.concatenate([old[4][n:], pad]),
+                   new[5][:width - n + 1] - np.concatenate([old[5][n:], pad]),
+                   lambda ks: stack[offsets, ks[:, None] + n - 1 - offsets])
+    if best.value is None:
+        raise ValueError('grid is smaller than the window')
+    return best.value
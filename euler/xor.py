@@ -0,0 +1,135 @@
+"""
+repeating-key XOR, and a frequency analysis attack on it
+
+Inputs can be anything supporting the buffer protocol (bytes, bytearray,
+memoryview, mmap, numpy arrays) and are viewed without copying.  The attack
+only needs per-stride byte histograms, so it can also consume an iterable of
+chunks, e.g. a multi-megabyte ciphertext streamed from disk.
+"""
+from functools import lru_cache
+
+# rough relative frequencies of bytes in english text
+LETTERS = {
+    'e': 12.7, 't': 9.1, 'a': 8.2, 'o': 7.5, 'i': 7.0, 'n': 6.7, 's': 6.3, 'h': 6.1, 'r': 6.0,
+    'd': 4.3, 'l': 4.0, 'c': 2.8, 'u': 2.8, 'm': 2.4, 'w': 2.4, 'f': 2.2, 'g': 2.0, 'y': 2.0,
+    'p': 1.9, 'b': 1.5, 'v': 1.0, 'k': 0.8, 'j': 0.15, 'x': 0.15, 'q': 0.1, 'z': 0.07,
+}
+
+
+@lru_cache()
+def english_weights():
+    """log likelihood of each byte value appearing in english plaintext"""
+    import numpy as np
+    freq = np.full(256, 1e-6)
+    freq[[9, 10, 13]] = 0.2
+    freq[32:127] = 0.01  # printable ascii
+    freq[ord('0'):ord('9') + 1] = 0.1
+    freq[[ord(c) for c in '.,\'"-()!?;:']] = 0.5
+    for c, f in LETTERS.items():
+        freq[ord(c)] = f
+        freq[ord(c.upper())] = f / 10
+    freq[ord(' ')] = 18.0
+    return np.log(freq / freq.sum())
+
+
+def _view(buffer):
+    import numpy as np
+    if isinstance(buffer, np.ndarray):
+        return buffer.view(np.uint8).reshape(-1)
+    return np.frombuffer(buffer, dtype=np.uint8)
+
+
+def _key(key):
+    import numpy as np
+    return np.frombuffer(key.encode('latin-1') if isinstance(key, str) else bytes(key), dtype=np.uint8)
+
+
+def xor_decrypt(buffer, key, offset=0, out=None):
+    """XOR buffer with key repeated, starting at position `offset` of the key
+
+    >>> bytes(xor_decrypt(b'\\x0b\\x0a\\x11', 'abc'))
+    b'jhr'
+    >>> bytes(xor_decrypt(xor_decrypt(b'attack at dawn', 'key'), b'key'))
+    b'attack at dawn'
+    >>> bytes(xor_decrypt(memoryview(b'xyz')[1:], 'ab', offset=1))
+    b'\\x1b\\x1b'"""
+    import numpy as np
+    data = _view(buffer)
+    key = np.roll(_key(key), -offset)
+    if out is None:
+        out = np.empty_like(data)
+    k = len(key)
+    full = len(data) - len(data) % k
+    np.bitwise_xor(data[:full].reshape(-1, k), key, out=out[:full].reshape(-1, k))
+    np.bitwise_xor(data[full:], key[:len(data) - full], out=out[full:])
+    return out
+
+
+def decrypt_stream(chunks, key):
+    """generate decrypted chunks, keeping the key phase across chunk boundaries"""
+    offset = 0
+    for chunk in chunks:
+        plain = xor_decrypt(chunk, key, offset % len(key))
+        offset += len(plain)
+        yield plain
+
+
+def chunked(buffer, size=1 << 20):
+    """zero copy slices of a buffer"""
+    view = memoryview(buffer).cast('B')
+    return (view[i:i + size] for i in range(0, len(view), size))
+
+
+def stride_histograms(source, key_lengths):
+    """{key length L: array of shape (L, 256)}, the byte histogram of each stride of the source"""
+    import numpy as np
+    hists = {L: np.zeros(L * 256, dtype=np.int64) for L in key_lengths}
+    try:
+        chunks = chunked(source)
+    except TypeError:
+        chunks = source
+    offset = 0
+    for chunk in chunks:
+        data = _view(chunk).astype(np.intp)
+        position = np.arange(offset, offset + len(data))
+        for L, hist in hists.items():
+            hist += np.bincount(position % L * 256 + data, minlength=L * 256)
+        offset += len(data)
+    return {L: hist.reshape(L, 256) for L, hist in hists.items()}
+
+
+def coincidence_index(hist):
+    """chance that two bytes drawn from the same stride are equal, averaged over the strides"""
+    n = hist.sum(axis=1)
+    return float(((hist * (hist - 1)).sum(axis=1) / (n * (n - 1)).clip(1)).mean())
+
+
+def best_key(hist, candidates=range(256)):
+    """the most english-like key byte for each stride histogram"""
+    import numpy as np
+    candidates = np.fromiter(candidates, dtype=np.uint8)
+    weights = english_weights()
+    # scores[i, c]: log likelihood of stride i decrypting with key byte candidates[c]
+    table = weights[np.arange(256)[:, None] ^ candidates[None, :]]
+    scores = hist @ table
+    return bytes(candidates[scores.argmax(axis=1)])
+
+
+def crack_key(source, key_length=None, candidates=range(256), max_key_length=32):
+    """recover the key of a repeating-key XOR ciphertext of english text
+
+    source is a buffer or an iterable of buffers.  When the key length is not
+    given, it is taken to be the shortest period whose strides look as far from
+    uniformly distributed as the best period (multiples of the true period
+    score about the same, other periods much lower).
+
+    >>> plain = b'it was the best of times, it was the worst of times, ' * 20
+    >>> crack_key(xor_decrypt(plain, 'euler'), candidates=b'abcdefghijklmnopqrstuvwxyz')
+    b'euler'"""
+    lengths = [key_length] if key_length else range(1, max_key_length + 1)
+    hists = stride_histograms(source, lengths)
+    if not key_length:
+        ic = {L: coincidence_index(h) for L, h in hists.items()}
+        best = max(ic.values())
+        key_length = min(L for L in lengths if ic[L] >= 0.9 * best)
+    return best_key(hists[key_length], candidates)